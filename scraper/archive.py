@@ -0,0 +1,81 @@
+"""
+Record/replay archive of fetched pages
+In record mode every page body fetched by a scraper is appended to a
+gzip-compressed JSON Lines file. In replay mode the scrapers are served
+from that file with no network access, for offline benchmarks and
+regression runs.
+"""
+
+import gzip
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PageArchive:
+    """Archive of url -> page body in a .jsonl.gz file"""
+
+    def __init__(self, path: Path, mode: str = "replay"):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unknown archive mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.served = 0
+        self.missing = 0
+        self._pages: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._file = None
+
+        if mode == "replay":
+            self._pages = self.load(path)
+            logger.info(f"Replaying {len(self._pages)} archived pages from {path}")
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Appending adds a new gzip member, which readers handle transparently
+            self._file = gzip.open(path, "at", encoding="utf-8")
+
+    @staticmethod
+    def load(path: Path) -> dict[str, str]:
+        pages = {}
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    pages[entry["url"]] = entry["body"]
+        return pages
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == "replay"
+
+    def record(self, url: str, body: str):
+        if self._file is None:
+            return
+        line = json.dumps({"url": url, "body": body}, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def replay(self, url: str) -> Optional[str]:
+        """Archived body for url, or None if it was never recorded"""
+        with self._lock:
+            body = self._pages.get(url)
+            if body is None:
+                self.missing += 1
+            else:
+                self.served += 1
+        if body is None:
+            logger.error(f"Not in archive: {url}")
+        return body
+
+    def urls(self) -> list[str]:
+        return list(self._pages)
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
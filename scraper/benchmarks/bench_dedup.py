@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark cross-source dedup (dedup.py)
+Builds synthetic boats, each listed by one to three sources with the
+usual differences (name formatting, ft/m rounding, small price gaps),
+times dedupe_yachts at growing sizes and checks the clusters against the
+known duplicates.
+
+Usage:
+    python benchmarks/bench_dedup.py --records 1000 10000 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from dedup import find_duplicates, dedupe_yachts
+from models import Yacht, YachtSource, YachtType
+
+MAKERS = ["YAMAHA", "Beneteau", "Jeanneau", "Bavaria", "Nissan", "Tohatsu", "Hanse", "Riviera", "Azimut", "Sea Ray"]
+TYPES = [YachtType.MOTOR, YachtType.SAILING, YachtType.CRUISER, YachtType.SPORTFISH]
+
+
+def make_listings(boats: int, seed: int = 0) -> tuple[list[Yacht], list[int]]:
+    """Listings of `boats` distinct boats and the boat number of each listing"""
+    rng = random.Random(seed)
+    sources = list(YachtSource)
+    yachts, truth = [], []
+    for boat in range(boats):
+        maker = rng.choice(MAKERS)
+        model = f"{rng.choice('ABCDEFGHJKLMNPRSTXY')}{rng.randint(20, 60)}-{rng.choice(['I', 'II', 'III', 'S', 'EX'])}"
+        length_m = round(rng.uniform(6, 18), 2)
+        year = rng.randint(1980, 2022)
+        price = rng.randrange(1_000_000, 80_000_000, 10_000)
+        yacht_type = rng.choice(TYPES)
+        for source in rng.sample(sources, rng.choice([1, 1, 2, 2, 3])):
+            length = round(length_m * rng.uniform(0.98, 1.02), 1)
+            yachts.append(Yacht(
+                id=f"{source.value}_{boat}",
+                source=source,
+                source_url=f"https://{source.value}.example/{boat}",
+                name=rng.choice([f"{maker} {model}", f"{maker.upper()} {model.replace('-', '')}", model]),
+                maker=rng.choice([maker, None]),
+                model=model,
+                price=rng.choice([price, int(price * rng.uniform(0.95, 1.05)), None]),
+                length_m=length,
+                length_ft=round(length * 3.28084, 1),
+                year_built=rng.choice([year, year, year, None]),
+                yacht_type=rng.choice([yacht_type, YachtType.OTHER]),
+            ))
+            truth.append(boat)
+    order = list(range(len(yachts)))
+    rng.shuffle(order)
+    return [yachts[i] for i in order], [truth[i] for i in order]
+
+
+def pair_quality(groups: list[list[int]], truth: list[int]) -> tuple[float, float]:
+    """Pairwise precision and recall of the clusters against the known boats"""
+    def pairs(clusters) -> set[tuple[int, int]]:
+        return {(a, b) for c in clusters for i, a in enumerate(c) for b in c[i + 1:]}
+
+    by_boat: dict[int, list[int]] = {}
+    for i, boat in enumerate(truth):
+        by_boat.setdefault(boat, []).append(i)
+    found, expected = pairs(groups), pairs(by_boat.values())
+    precision = len(found & expected) / len(found) if found else 1.0
+    recall = len(found & expected) / len(expected) if expected else 1.0
+    return precision, recall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cross-source dedup")
+    parser.add_argument("--records", type=int, nargs="+", default=[1000, 10000, 20000],
+                        help="Approximate listing counts to time")
+    args = parser.parse_args()
+
+    for target in args.records:
+        # ~1.8 listings per boat
+        yachts, truth = make_listings(max(1, int(target / 1.8)))
+
+        start = time.perf_counter()
+        groups = find_duplicates(yachts)
+        cluster_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = dedupe_yachts(yachts)
+        total_s = time.perf_counter() - start
+
+        precision, recall = pair_quality(groups, truth)
+        print(f"{len(yachts):>7} listings -> {len(result):>6} yachts: cluster {cluster_s:.3f}s, "
+              f"total {total_s:.3f}s ({len(yachts) / total_s:,.0f} records/sec), "
+              f"precision {precision:.3f}, recall {recall:.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Offline end-to-end benchmark of the scrapers against a recorded archive
+Replays each source's scrape_all from a page archive (main.py --record)
+with no network access and reports pages/sec, parse ms per page and
+normalize ms per record. Exits with status 1 when a threshold is missed.
+
+Usage:
+    python main.py --record archives/run.jsonl.gz --max-items 50
+    python benchmarks/bench_e2e.py --archive archives/run.jsonl.gz
+"""
+
+import argparse
+import json
+import sys
+import time
+from functools import wraps
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from main import SCRAPERS, normalize_batch, memoized_parsers
+from archive import PageArchive
+
+DEFAULT_THRESHOLDS = Path(__file__).parent / "thresholds.json"
+
+
+def timed(func, totals: dict):
+    """Wrap a parse method to accumulate its call count and time"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            totals["calls"] += 1
+            totals["seconds"] += time.perf_counter() - start
+    return wrapper
+
+
+def bench_source(name: str, archive: PageArchive, max_items: int) -> dict:
+    scraper = SCRAPERS[name]()
+    scraper.archive = archive
+    parse_totals = {"calls": 0, "seconds": 0.0}
+    scraper.parse_list_page = timed(scraper.parse_list_page, parse_totals)
+    scraper.parse_detail_page = timed(scraper.parse_detail_page, parse_totals)
+
+    served_before = archive.served
+    start = time.perf_counter()
+    raws = scraper.scrape_all(max_items=max_items)
+    scrape_s = time.perf_counter() - start
+    pages = archive.served - served_before
+
+    start = time.perf_counter()
+    normalize_batch(raws, memoized_parsers())
+    normalize_s = time.perf_counter() - start
+
+    return {
+        "pages": pages,
+        "records": len(raws),
+        "pages_per_sec": pages / scrape_s if scrape_s else 0.0,
+        "parse_ms_per_page": parse_totals["seconds"] * 1000 / max(parse_totals["calls"], 1),
+        "normalize_ms_per_record": normalize_s * 1000 / max(len(raws), 1),
+    }
+
+
+def check_thresholds(name: str, result: dict, thresholds: dict) -> list[str]:
+    limits = {**thresholds.get("default", {}), **thresholds.get(name, {})}
+    failures = []
+    if result["pages_per_sec"] < limits.get("min_pages_per_sec", 0):
+        failures.append(f"pages/sec {result['pages_per_sec']:.1f} < {limits['min_pages_per_sec']}")
+    for key in ("parse_ms_per_page", "normalize_ms_per_record"):
+        limit = limits.get(f"max_{key}")
+        if limit is not None and result[key] > limit:
+            failures.append(f"{key} {result[key]:.2f} > {limit}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end scraper benchmark")
+    parser.add_argument("--archive", type=Path, required=True, help="Archive recorded with main.py --record")
+    parser.add_argument("--thresholds", type=Path, default=DEFAULT_THRESHOLDS)
+    parser.add_argument("--max-items", type=int, default=1000)
+    parser.add_argument("--json", type=Path, help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    archive = PageArchive(args.archive, mode="replay")
+    thresholds = json.loads(args.thresholds.read_text()) if args.thresholds.exists() else {}
+
+    results = {}
+    failed = False
+    print(f"{'source':<10} {'pages':>6} {'records':>8} {'pages/s':>9} {'parse ms':>9} {'norm ms':>8}  status")
+    for name in SCRAPERS:
+        result = bench_source(name, archive, args.max_items)
+        if not result["pages"]:
+            print(f"{name:<10} no archived pages")
+            continue
+        failures = check_thresholds(name, result, thresholds)
+        result["failures"] = failures
+        results[name] = result
+        failed = failed or bool(failures)
+        print(f"{name:<10} {result['pages']:>6} {result['records']:>8} {result['pages_per_sec']:>9.1f} "
+              f"{result['parse_ms_per_page']:>9.2f} {result['normalize_ms_per_record']:>8.3f}  "
+              f"{'; '.join(failures) if failures else 'ok'}")
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark normalize_yacht (per record) against normalize_batch
+Uses synthetic records built from a small pool of repeated raw strings,
+like historical re-normalizations, and checks both paths agree.
+
+Usage:
+    python benchmarks/bench_normalize.py --records 20000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from main import normalize_yacht, normalize_batch
+from models import ScrapedYachtRaw, YachtSource
+
+PRICES = ["210万円", "285万円", "1,280万円", "応相談", "3500000円", "980", None]
+LENGTHS = ["26ft", "8.5m", "32フィート", "30", "7.2", None]
+YEARS = ["2005年", "1998", "進水 2012", None]
+HORSEPOWERS = ["250PS", "2x 370HP", "27馬力", None]
+TYPES = ["sailing", "クルーザー", "モーターボート", "フィッシングボート", None]
+STATUSES = ["available", "商談中", "SOLD", "入荷予定", None]
+NAMES = ["YAMAHA Y26-II", "Newport 28", "ARICA 27", "Beneteau First 35", "SR-310", ""]
+
+
+def make_records(count: int, seed: int = 0) -> list[ScrapedYachtRaw]:
+    rng = random.Random(seed)
+    return [
+        ScrapedYachtRaw(
+            source=rng.choice(list(YachtSource)),
+            source_url=f"https://example.com/{i}",
+            source_id=f"bench_{i}",
+            raw_name=rng.choice(NAMES),
+            raw_type=rng.choice(TYPES),
+            raw_price=rng.choice(PRICES),
+            raw_length=rng.choice(LENGTHS),
+            raw_year=rng.choice(YEARS),
+            raw_horsepower=rng.choice(HORSEPOWERS),
+            raw_status=rng.choice(STATUSES),
+        )
+        for i in range(count)
+    ]
+
+
+def comparable(yacht) -> dict:
+    return yacht.model_dump(exclude={"created_at", "updated_at", "last_scraped_at"})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark record normalization")
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+
+    start = time.perf_counter()
+    single = [normalize_yacht(raw) for raw in records]
+    single_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = normalize_batch(records)
+    batch_s = time.perf_counter() - start
+
+    same = [comparable(y) for y in single] == [comparable(y) for y in batch]
+    print(f"normalize_yacht: {args.records / single_s:>10.0f} records/sec")
+    print(f"normalize_batch: {args.records / batch_s:>10.0f} records/sec ({single_s / batch_s:.2f}x)")
+    print(f"output: {'identical' if same else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark HTML parser backends on saved pages
+Compares parse time and output of each backend against full BeautifulSoup
+
+Usage:
+    python benchmarks/bench_parsers.py --pages saved_pages/ --repeat 5
+
+Expected layout: <pages>/<source>/list/*.html and <pages>/<source>/detail/*.html
+where source is aoki, boatworld or chukotei and detail file names are the
+URL-quoted page URL (urllib.parse.quote(url, safe="")).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from sources import AokiYachtScraper, BoatWorldScraper, ChukoteiScraper
+from sources.parsers import make_soup
+
+SCRAPERS = {
+    "aoki": AokiYachtScraper,
+    "boatworld": BoatWorldScraper,
+    "chukotei": ChukoteiScraper,
+}
+
+
+def load_pages(directory: Path) -> list[tuple[str, str]]:
+    if not directory.is_dir():
+        return []
+    return [(unquote(p.stem), p.read_text(encoding="utf-8")) for p in sorted(directory.glob("*.html"))]
+
+
+def time_backend(pages, parse, repeat: int) -> tuple[float, list]:
+    """Return ms per page (best of repeat) and the parse results"""
+    best = float("inf")
+    results = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [parse(url, html) for url, html in pages]
+        best = min(best, time.perf_counter() - start)
+    return best * 1000 / max(len(pages), 1), results
+
+
+def comparable(result):
+    if isinstance(result, list):
+        return result
+    return result.model_dump(exclude={"scraped_at"}) if result else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parser backends on saved pages")
+    parser.add_argument("--pages", type=Path, required=True, help="Directory of saved pages")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'source':<10} {'page':<7} {'backend':<9} {'ms/page':>9} {'speedup':>8}  output")
+    for name, scraper_cls in SCRAPERS.items():
+        scraper = scraper_cls()
+        list_pages = load_pages(args.pages / name / "list")
+        detail_pages = load_pages(args.pages / name / "detail")
+
+        cases = [
+            ("list", list_pages, ["bs4", "strained", "lxml"],
+             lambda backend: lambda url, html: scraper.parse_list_page(
+                 make_soup(html, backend, scraper.list_strainer))),
+            ("detail", detail_pages, ["bs4", "lxml"],
+             lambda backend: lambda url, html: scraper.parse_detail_page(make_soup(html, backend), url)),
+        ]
+
+        for kind, pages, backends, make_parse in cases:
+            if not pages:
+                continue
+            baseline_ms, baseline = time_backend(pages, make_parse("bs4"), args.repeat)
+            expected = [comparable(r) for r in baseline]
+            for backend in backends:
+                ms, results = time_backend(pages, make_parse(backend), args.repeat)
+                same = [comparable(r) for r in results] == expected
+                print(f"{name:<10} {kind:<7} {backend:<9} {ms:>9.2f} {baseline_ms / ms:>7.1f}x  "
+                      f"{'identical' if same else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
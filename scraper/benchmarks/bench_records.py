@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Benchmark the trusted record path against validating every stage
+"validated" builds each ScrapedYachtRaw and Yacht through Pydantic
+validation (the old path); "trusted" still validates the scraped raw
+records but builds Yacht with TrustedModel.trusted() in normalization
+and validates it once at export (the current path).
+Reports CPU time and memory held per 10k records for building Yacht and
+for the whole parse -> normalize stretch, and checks that both paths
+export the same JSON.
+
+Usage:
+    python benchmarks/bench_records.py --records 10000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from bench_normalize import HORSEPOWERS, LENGTHS, NAMES, PRICES, STATUSES, TYPES, YEARS
+from exporter import validate_yacht
+from main import PARSERS, normalize_fields, normalize_yacht
+from models import ScrapedYachtRaw, Yacht, YachtSource
+
+
+def raw_fields(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        dict(
+            source=rng.choice(list(YachtSource)),
+            source_url=f"https://example.com/{i}",
+            source_id=f"bench_{i}",
+            raw_name=rng.choice(NAMES),
+            raw_type=rng.choice(TYPES),
+            raw_price=rng.choice(PRICES),
+            raw_length=rng.choice(LENGTHS),
+            raw_year=rng.choice(YEARS),
+            raw_horsepower=rng.choice(HORSEPOWERS),
+            raw_status=rng.choice(STATUSES),
+            images=[f"https://example.com/{i}/{n}.jpg" for n in range(rng.randint(0, 10))],
+        )
+        for i in range(count)
+    ]
+
+
+def validated_path(fields: list[dict]) -> list[Yacht]:
+    raws = [ScrapedYachtRaw(**f) for f in fields]
+    return [Yacht(**normalize_fields(raw, PARSERS)) for raw in raws]
+
+
+def trusted_path(fields: list[dict]) -> list[Yacht]:
+    raws = [ScrapedYachtRaw(**f) for f in fields]
+    now = datetime.utcnow()
+    return [normalize_yacht(raw, PARSERS, now) for raw in raws]
+
+
+def cpu_time(build: Callable[[], object], repeat: int) -> float:
+    """Best CPU seconds over repeat runs, with GC paused so collections do not add noise"""
+    best = float("inf")
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.process_time()
+            build()
+            best = min(best, time.process_time() - start)
+    finally:
+        gc.enable()
+    return best
+
+
+def memory_held(build: Callable[[], object]) -> int:
+    """Bytes still allocated while the built records are alive"""
+    tracemalloc.start()
+    records = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del records
+    return size
+
+
+def exported(yachts: list[Yacht]) -> list[dict]:
+    timestamps = {"created_at", "updated_at", "last_scraped_at"}
+    return [validate_yacht(y).model_dump(mode="json", exclude=timestamps) for y in yachts]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the trusted record path")
+    parser.add_argument("--records", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    fields = raw_fields(args.records)
+    raws = [ScrapedYachtRaw(**f) for f in fields]
+    normalized = [normalize_fields(raw, PARSERS) for raw in raws]
+    now = datetime.utcnow()
+    scale = 10000 / args.records
+
+    rows = [
+        ("Yacht", lambda: [Yacht(**n) for n in normalized],
+         lambda: [Yacht.trusted(**n, created_at=now, updated_at=now, last_scraped_at=now) for n in normalized]),
+        ("parse -> normalize", lambda: validated_path(fields), lambda: trusted_path(fields)),
+    ]
+    print(f"{'per 10k records':22}{'validated ms':>14}{'trusted ms':>12}{'saved':>8}"
+          f"{'validated MB':>14}{'trusted MB':>12}")
+    for name, validated, trusted in rows:
+        v_cpu, t_cpu = cpu_time(validated, args.repeat), cpu_time(trusted, args.repeat)
+        v_mem, t_mem = memory_held(validated), memory_held(trusted)
+        print(f"{name:22}{v_cpu * 1000 * scale:>14.1f}{t_cpu * 1000 * scale:>12.1f}{1 - t_cpu / v_cpu:>8.0%}"
+              f"{v_mem / 1e6 * scale:>14.2f}{t_mem / 1e6 * scale:>12.2f}")
+
+    trusted = trusted_path(fields)
+    export_cpu = cpu_time(lambda: [validate_yacht(y) for y in trusted], args.repeat)
+    print(f"{'export validation':22}{'':>14}{export_cpu * 1000 * scale:>12.1f}  (once, at the boundary)")
+
+    same = exported(validated_path(fields)) == exported(trusted)
+    print(f"export: {'identical' if same else 'DIFFERS'}")
+
+
+if __name__ == "__main__":
+    main()
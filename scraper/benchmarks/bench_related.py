@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark the related-yacht precomputation
+Times the NumPy pass for each inventory size (best CPU time of --repeat
+runs) and the pure-Python fallback on the smaller sizes, and checks that
+both pick the same related yachts. Fails when the NumPy pass over the
+largest size exceeds --budget seconds.
+
+Usage:
+    python benchmarks/bench_related.py --records 1000 10000
+"""
+
+import argparse
+import gc
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import related
+from related import RelatedIndex
+
+TYPES = ["motor", "sailing", "catamaran", "cruiser", "sportfish", "other"]
+STATUSES = ["available"] * 8 + ["negotiating", "incoming"]
+
+
+def records(count: int, seed: int = 0) -> list[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": f"bench_{i}",
+            "yacht_type": rng.choice(TYPES),
+            "status": rng.choice(STATUSES),
+            "price": rng.choice([None, rng.randrange(500_000, 200_000_000, 10_000)]),
+            "length_m": rng.choice([None, round(rng.uniform(5, 30), 2)]),
+            "year_built": rng.choice([None, rng.randint(1975, 2025)]),
+        }
+        for i in range(count)
+    ]
+
+
+def build(data: list[dict], use_numpy: bool) -> tuple[float, dict]:
+    index = RelatedIndex()
+    for record in data:
+        index.add(record)
+    numpy = related.np
+    if not use_numpy:
+        related.np = None
+    gc.disable()
+    try:
+        start = time.process_time()
+        result = index.build()
+        return time.process_time() - start, result
+    finally:
+        gc.enable()
+        related.np = numpy
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark related-yacht precomputation")
+    parser.add_argument("--records", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--python-max", type=int, default=2000,
+                        help="Largest size also run (and compared) with the pure-Python fallback")
+    parser.add_argument("--budget", type=float, default=1.0, help="Seconds allowed for the largest NumPy pass")
+    args = parser.parse_args()
+
+    if related.np is None:
+        print("NumPy is not installed, only the pure-Python fallback is available")
+
+    print(f"{'yachts':>8}{'numpy s':>10}{'python s':>10}  result")
+    numpy_seconds = None
+    for count in args.records:
+        data = records(count)
+        numpy_seconds, numpy_result = None, None
+        if related.np is not None:
+            runs = [build(data, use_numpy=True) for _ in range(args.repeat)]
+            numpy_seconds, numpy_result = min(r[0] for r in runs), runs[0][1]
+        python_seconds, python_result = None, None
+        if count <= args.python_max:
+            python_seconds, python_result = build(data, use_numpy=False)
+
+        same = "" if numpy_result is None or python_result is None else \
+            ("identical" if numpy_result == python_result else "DIFFERS")
+        print(f"{count:>8}{numpy_seconds if numpy_seconds is not None else float('nan'):>10.3f}"
+              f"{python_seconds if python_seconds is not None else float('nan'):>10.3f}  {same}")
+        if same == "DIFFERS":
+            sys.exit(1)
+
+    if numpy_seconds is not None and numpy_seconds > args.budget:
+        print(f"FAIL: {numpy_seconds:.3f}s over the {args.budget}s budget for {args.records[-1]} yachts")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Checkpoint journal for resumable scrape runs
+An append-only JSON Lines file of the list pages walked and the records
+scraped, per source, written in batches (flushed and fsynced every
+batch_size entries). A run started with --resume reloads it: journaled
+records are emitted again without fetching, detail pages already in the
+journal are skipped, and list pages whose every listing has a record are
+not fetched at all. The journal is removed once the run has exported.
+
+A line cut short by a crash is ignored on load.
+"""
+
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from models import ScrapedYachtRaw
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 20
+
+
+class JournalPage(NamedTuple):
+    """A walked list page: its detail URLs and the next list page"""
+    detail_urls: list[str]
+    next_url: Optional[str]
+
+
+class CheckpointJournal:
+    """Journal of list pages and scraped records, reloaded with resume=True"""
+
+    def __init__(self, path: Path, resume: bool = False, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.path = path
+        self.batch_size = batch_size
+        self._pages: dict[str, dict[str, JournalPage]] = {}
+        self._records: dict[str, dict[str, ScrapedYachtRaw]] = {}
+        self._pending: list[str] = []
+        self._lock = threading.Lock()
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if resume and path.exists():
+            self.load()
+            logger.info(f"Resuming from {path}: "
+                        + ", ".join(f"{source} {len(records)} records" for source, records in self._records.items()))
+        # Without resume an old journal belongs to another run
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+        if resume and self._file.tell() and not self._ends_with_newline():
+            # Start after the line a crash cut short instead of continuing it
+            self._file.write("\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def load(self):
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Skipping a truncated checkpoint entry in {self.path}")
+                    continue
+                source = entry["source"]
+                if entry["kind"] == "page":
+                    self._pages.setdefault(source, {})[entry["url"]] = JournalPage(entry["details"], entry["next"])
+                elif entry["kind"] == "record":
+                    # Read back from disk, so validated like any outside input
+                    record = ScrapedYachtRaw.model_validate(entry["record"])
+                    self._records.setdefault(source, {})[entry["url"]] = record
+
+    def records(self, source: str) -> list[ScrapedYachtRaw]:
+        with self._lock:
+            return list(self._records.get(source, {}).values())
+
+    def has_record(self, source: str, url: str) -> bool:
+        with self._lock:
+            return url in self._records.get(source, {})
+
+    def finished_page(self, source: str, url: str) -> Optional[JournalPage]:
+        """The journaled page if every listing on it has a record"""
+        with self._lock:
+            page = self._pages.get(source, {}).get(url)
+            records = self._records.get(source, {})
+            if page and all(detail_url in records for detail_url in page.detail_urls):
+                return page
+        return None
+
+    def add_page(self, source: str, url: str, detail_urls: list[str], next_url: Optional[str]):
+        with self._lock:
+            self._pages.setdefault(source, {})[url] = JournalPage(detail_urls, next_url)
+            self._append({"kind": "page", "source": source, "url": url, "details": detail_urls, "next": next_url})
+
+    def add_record(self, source: str, url: str, record: ScrapedYachtRaw):
+        with self._lock:
+            self._records.setdefault(source, {})[url] = record
+            self._append({"kind": "record", "source": source, "url": url,
+                          "record": record.model_dump(mode="json", warnings=False)})
+
+    def _append(self, entry: dict):
+        self._pending.append(json.dumps(entry, ensure_ascii=False))
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        self._file.write("\n".join(self._pending) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = []
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def close(self, completed: bool = False):
+        """Flush and close; a completed run has no use for its journal"""
+        with self._lock:
+            self._flush()
+            self._file.close()
+            if completed:
+                self.path.unlink(missing_ok=True)
@@ -0,0 +1,233 @@
+"""
+Cross-source duplicate detection
+The same boat is often listed by several brokers. Normalized yachts are
+blocked on (maker/model/name token, length bucket, year) so only records
+sharing a block are compared, scored on token overlap and spec closeness,
+and clustered with union-find. Only each record's rarest tokens are used
+for blocking (model names rather than "yamaha"), which keeps blocks small
+and the pass near-linear. Each cluster becomes one canonical Yacht that
+keeps every source URL.
+"""
+
+import gc
+import logging
+import re
+import time
+import unicodedata
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from models import Yacht, YachtType
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_THRESHOLD = 0.75
+# Length bucket width in meters, neighbouring buckets are probed as well
+LENGTH_BUCKET_M = 0.5
+# Rarest tokens of a record used as blocking keys
+BLOCKING_TOKENS = 1
+# Blocks larger than this stop growing, so a very common token cannot
+# turn the pass quadratic
+MAX_BLOCK_SIZE = 200
+
+# Tokens too generic to identify a boat
+STOP_TOKENS = frozenset({"yacht", "boat", "the", "ヨット", "ボート", "中古", "中古艇", "艇"})
+# Separators inside model names ("Y26-II", "SR-310", "First 35.7")
+JOINERS_RE = re.compile(r"(?<=\w)[-_./](?=\w)")
+TOKEN_RE = re.compile(r"\w+")
+
+# Similarity weights, fields missing on either side drop out of the score
+WEIGHTS = {"tokens": 0.45, "length": 0.2, "year": 0.15, "price": 0.15, "type": 0.05}
+
+# Stands in for a known value when probing records that lack it
+ANY = "*"
+
+# Fields never copied from a duplicate into the canonical record
+IDENTITY_FIELDS = {"id", "source", "source_url", "source_urls", "created_at", "updated_at", "last_scraped_at"}
+
+
+def tokenize(*texts: Optional[str]) -> frozenset[str]:
+    """Lowercased NFKC tokens of maker/model/name text"""
+    tokens = set()
+    for text in texts:
+        if not text:
+            continue
+        text = JOINERS_RE.sub("", unicodedata.normalize("NFKC", text).lower())
+        tokens.update(t for t in TOKEN_RE.findall(text) if t not in STOP_TOKENS)
+    return frozenset(tokens)
+
+
+@dataclass(frozen=True)
+class _Features:
+    source: str
+    tokens: frozenset[str]
+    length_bucket: Optional[int]
+    length_m: Optional[float]
+    year: Optional[int]
+    price: Optional[int]
+    yacht_type: str
+
+    @classmethod
+    def of(cls, yacht: Yacht) -> "_Features":
+        return cls(
+            source=yacht.source,
+            tokens=tokenize(yacht.maker, yacht.model, yacht.name),
+            length_bucket=int(yacht.length_m // LENGTH_BUCKET_M) if yacht.length_m else None,
+            length_m=yacht.length_m,
+            year=yacht.year_built,
+            price=yacht.price,
+            yacht_type=yacht.yacht_type,
+        )
+
+    def index_keys(self, tokens: list[str]) -> set[tuple]:
+        """Blocks this record joins: its own values, plus ANY for records missing them"""
+        return {(token, b, y) for token in tokens
+                for b in (self.length_bucket, ANY) for y in (self.year, ANY)}
+
+    def probe_keys(self, tokens: list[str]) -> set[tuple]:
+        """Blocks holding candidates: neighbouring values or unknown ones, ANY when this record lacks one"""
+        if self.length_bucket is None:
+            buckets = [ANY]
+        else:
+            buckets = [self.length_bucket - 1, self.length_bucket, self.length_bucket + 1, None]
+        years = [ANY] if self.year is None else [self.year - 1, self.year, self.year + 1, None]
+        return {(token, b, y) for token in tokens for b in buckets for y in years}
+
+
+def _closeness(a: float, b: float) -> float:
+    return 1 - abs(a - b) / max(a, b) if max(a, b) > 0 else 1.0
+
+
+def similarity(a: _Features, b: _Features) -> float:
+    """Weighted 0..1 score over the fields both records have"""
+    scores = {}
+    if a.tokens and b.tokens:
+        # Overlap rather than Jaccard: one listing often omits the maker
+        scores["tokens"] = len(a.tokens & b.tokens) / min(len(a.tokens), len(b.tokens))
+    if a.length_m and b.length_m:
+        # Listings round differently (ft vs m), a 10% gap scores zero
+        scores["length"] = max(0.0, 1 - (1 - _closeness(a.length_m, b.length_m)) * 10)
+    if a.year and b.year:
+        scores["year"] = {0: 1.0, 1: 0.5}.get(abs(a.year - b.year), 0.0)
+    if a.price and b.price:
+        scores["price"] = max(0.0, 1 - (1 - _closeness(a.price, b.price)) * 2)
+    if a.yacht_type != YachtType.OTHER and b.yacht_type != YachtType.OTHER:
+        scores["type"] = float(a.yacht_type == b.yacht_type)
+    if "tokens" not in scores:
+        return 0.0
+    total = sum(WEIGHTS[k] for k in scores)
+    return sum(WEIGHTS[k] * v for k, v in scores.items()) / total
+
+
+class _Clusters:
+    """Union-find that never joins two records from the same source"""
+
+    def __init__(self, sources: list[str]):
+        self.parent = list(range(len(sources)))
+        self.sources = [{s} for s in sources]
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int) -> bool:
+        ri, rj = self.find(i), self.find(j)
+        if ri == rj or self.sources[ri] & self.sources[rj]:
+            return False
+        if rj < ri:
+            ri, rj = rj, ri
+        self.parent[rj] = ri
+        self.sources[ri] |= self.sources[rj]
+        return True
+
+
+def _is_missing(field: str, value) -> bool:
+    return value is None or value == "" or value == [] or (field == "yacht_type" and value == YachtType.OTHER)
+
+
+def merge_cluster(yachts: list[Yacht]) -> Yacht:
+    """Canonical record: the most complete listing, gaps filled from the others"""
+    canonical = max(yachts, key=lambda y: sum(not _is_missing(f, v) for f, v in y))
+    update = {}
+    for field, value in canonical:
+        if field in IDENTITY_FIELDS or not _is_missing(field, value):
+            continue
+        for other in yachts:
+            if not _is_missing(field, getattr(other, field)):
+                update[field] = getattr(other, field)
+                break
+    update["images"] = list(dict.fromkeys(img for y in [canonical, *yachts] for img in y.images))
+    update["source_urls"] = list(dict.fromkeys(url for y in yachts for url in (y.source_urls or [y.source_url])))
+    return canonical.model_copy(update=update)
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    """The block index allocates many small containers, and cyclic GC passes
+    over them would make the pass superlinear"""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def find_duplicates(yachts: list[Yacht], threshold: float = DEFAULT_THRESHOLD) -> list[list[int]]:
+    """Indexes of likely-duplicate yachts grouped into clusters (in input order)"""
+    features = [_Features.of(y) for y in yachts]
+    frequency: dict[str, int] = {}
+    for feat in features:
+        for token in feat.tokens:
+            frequency[token] = frequency.get(token, 0) + 1
+
+    clusters = _Clusters([f.source for f in features])
+    index: dict[tuple, list[int]] = {}
+    comparisons = 0
+    capped = 0
+
+    with _gc_paused():
+        for i, feat in enumerate(features):
+            # A token seen once cannot be shared with another record
+            shared = [t for t in feat.tokens if frequency[t] > 1]
+            tokens = sorted(shared, key=lambda t: (frequency[t], t))[:BLOCKING_TOKENS]
+            candidates = set()
+            for key in feat.probe_keys(tokens):
+                candidates.update(index.get(key, ()))
+            for j in sorted(candidates):
+                if features[j].source == feat.source:
+                    continue
+                comparisons += 1
+                if similarity(feat, features[j]) >= threshold:
+                    clusters.union(j, i)
+
+            for key in feat.index_keys(tokens):
+                block = index.setdefault(key, [])
+                if len(block) < MAX_BLOCK_SIZE:
+                    block.append(i)
+                else:
+                    capped += 1
+
+    groups: dict[int, list[int]] = {}
+    for i in range(len(yachts)):
+        groups.setdefault(clusters.find(i), []).append(i)
+    logger.info(f"Dedup: {comparisons} comparisons, {len(index)} blocks, {capped} capped block entries")
+    return list(groups.values())
+
+
+def dedupe_yachts(yachts: Iterable[Yacht], threshold: float = DEFAULT_THRESHOLD) -> list[Yacht]:
+    """Collapse cross-source duplicates into one canonical Yacht per cluster"""
+    yachts = list(yachts)
+    start = time.perf_counter()
+    groups = find_duplicates(yachts, threshold)
+    result = [merge_cluster([yachts[i] for i in group]) for group in groups]
+    elapsed = time.perf_counter() - start
+
+    duplicates = [group for group in groups if len(group) > 1]
+    logger.info(f"Dedup: {len(yachts)} records -> {len(result)} yachts "
+                f"({sum(map(len, duplicates))} records in {len(duplicates)} clusters) in {elapsed:.3f}s")
+    return result
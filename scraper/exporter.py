@@ -0,0 +1,335 @@
+"""
+Streaming JSON export for the frontend
+Records are encoded one at a time into temp files that are renamed into
+place only once complete, so a crash never leaves a half-written file.
+Uses orjson when it is installed and falls back to the json module.
+
+This is the validation boundary: yachts are built unvalidated with
+TrustedModel.trusted() upstream and validated here, once, before they
+are written.
+
+In delta mode the records are compared with the previous export: a change
+manifest (added / removed / updated ids and fields) is written next to it,
+and the export files are left untouched when nothing changed.
+
+With indexes enabled, <stem>.index.json (see indexes.py) is built from the
+same records and committed together with the main file, as is
+<stem>.related.json (see related.py) with related yachts enabled.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Iterable, Optional
+
+from pydantic import ValidationError
+
+from indexes import YachtIndex
+from models import Yacht
+from related import RelatedIndex
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Encode JSON-compatible data as UTF-8 bytes"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
+
+class AtomicFile:
+    """Binary file written to a temp path and renamed over the target on commit"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self.tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        self.file: IO[bytes] = os.fdopen(fd, "wb")
+
+    def write(self, data: bytes):
+        self.file.write(data)
+
+    def commit(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.chmod(self.tmp_path, 0o644)
+        os.replace(self.tmp_path, self.path)
+
+    def discard(self):
+        self.file.close()
+        if os.path.exists(self.tmp_path):
+            os.unlink(self.tmp_path)
+
+
+class JsonExportFile:
+    """The frontend format ({"yachts": [...], "meta": {...}}), written record by record"""
+
+    def __init__(self, path: Path):
+        self.out = AtomicFile(path)
+        self.count = 0
+        self.sources: dict[str, None] = {}
+        self.out.write(b'{\n  "yachts": [')
+
+    def write(self, record: dict):
+        # Nest the pretty-printed record two levels deep, like json.dump(indent=2)
+        body = dumps(record, indent=True).replace(b"\n", b"\n    ")
+        self.out.write((b",\n    " if self.count else b"\n    ") + body)
+        self.count += 1
+        self.sources[record["source"]] = None
+
+    def commit(self):
+        meta = {
+            "count": self.count,
+            "scraped_at": datetime.utcnow().isoformat(),
+            "sources": list(self.sources),
+        }
+        closing = b"\n  ]" if self.count else b"]"
+        self.out.write(closing + b',\n  "meta": ' + dumps(meta, indent=True).replace(b"\n", b"\n  ") + b"\n}\n")
+        self.out.commit()
+
+    def discard(self):
+        self.out.discard()
+
+
+class NdjsonExportFile:
+    """One compact JSON record per line"""
+
+    def __init__(self, path: Path):
+        self.out = AtomicFile(path)
+        self.count = 0
+
+    def write(self, record: dict):
+        self.out.write(dumps(record) + b"\n")
+        self.count += 1
+
+    def commit(self):
+        self.out.commit()
+
+    def discard(self):
+        self.out.discard()
+
+
+class IndexExportFile:
+    """Lookup / facet / sort indexes of the main file, written on commit"""
+
+    def __init__(self, path: Path):
+        self.out = AtomicFile(path)
+        self.index = YachtIndex()
+
+    def write(self, record: dict):
+        self.index.add(record)
+
+    def commit(self):
+        self.out.write(dumps(self.index.build()))
+        self.out.commit()
+
+    def discard(self):
+        self.out.discard()
+
+
+class RelatedExportFile:
+    """Top related yacht ids per exported yacht, written on commit"""
+
+    def __init__(self, path: Path, limit: int):
+        self.out = AtomicFile(path)
+        self.related = RelatedIndex(limit)
+
+    def write(self, record: dict):
+        self.related.add(record)
+
+    def commit(self):
+        self.out.write(dumps({"limit": self.related.limit, "related": self.related.build()}))
+        self.out.commit()
+
+    def discard(self):
+        self.out.discard()
+
+
+# Fields that move on every run without the listing itself changing
+VOLATILE_FIELDS = {"created_at", "updated_at", "last_scraped_at"}
+
+
+class ExportDelta:
+    """Changes between the previous export file and the records being exported"""
+
+    def __init__(self, previous_path: Path):
+        self.previous = self.load(previous_path)
+        self.added: list[str] = []
+        self.updated: dict[str, list[str]] = {}
+        self._seen: set[str] = set()
+
+    @staticmethod
+    def load(path: Path) -> dict[str, dict]:
+        if not path.exists():
+            return {}
+        try:
+            data = json.loads(path.read_bytes())
+        except ValueError as e:
+            logger.warning(f"Previous export {path} is unreadable, treating every record as new: {e}")
+            return {}
+        return {record["id"]: record for record in data.get("yachts", [])}
+
+    def record(self, record: dict):
+        yacht_id = record["id"]
+        self._seen.add(yacht_id)
+        old = self.previous.get(yacht_id)
+        if old is None:
+            self.added.append(yacht_id)
+            return
+        fields = sorted(k for k in record.keys() | old.keys()
+                        if k not in VOLATILE_FIELDS and record.get(k) != old.get(k))
+        if fields:
+            self.updated[yacht_id] = fields
+
+    @property
+    def removed(self) -> list[str]:
+        return [yacht_id for yacht_id in self.previous if yacht_id not in self._seen]
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def manifest(self) -> dict:
+        return {
+            "generated_at": datetime.utcnow().isoformat(),
+            "changed": self.changed,
+            "previous_count": len(self.previous),
+            "count": len(self._seen),
+            "added": self.added,
+            "removed": self.removed,
+            "updated": self.updated,
+        }
+
+
+def validate_yacht(yacht: Yacht) -> Yacht:
+    """Fully validated copy of a yacht built with Yacht.trusted()"""
+    return Yacht.model_validate(yacht.__dict__)
+
+
+class YachtExporter:
+    """Streams yachts to the main export file plus optional NDJSON and per-source shards.
+
+    Use as a context manager; files are only moved into place if the block
+    completes without an exception.
+    """
+
+    def __init__(self, output_path: Path, ndjson: bool = False, shard_by_source: bool = False,
+                 delta: bool = False, indexes: bool = False, related: Optional[int] = None):
+        self.output_path = output_path
+        self.shard_by_source = shard_by_source
+        # Read before the new files are opened
+        self.delta: Optional[ExportDelta] = ExportDelta(output_path) if delta else None
+        self.unchanged = False
+        self.main = JsonExportFile(output_path)
+        self.ndjson = NdjsonExportFile(output_path.with_suffix(".ndjson")) if ndjson else None
+        self.indexes = IndexExportFile(self.index_path) if indexes else None
+        self.related = RelatedExportFile(self.related_path, related) if related else None
+        self.shards: dict[str, JsonExportFile] = {}
+        self.rejected = 0
+
+    @property
+    def manifest_path(self) -> Path:
+        return self.output_path.with_name(f"{self.output_path.stem}.changes.json")
+
+    @property
+    def index_path(self) -> Path:
+        return self.output_path.with_name(f"{self.output_path.stem}.index.json")
+
+    @property
+    def related_path(self) -> Path:
+        return self.output_path.with_name(f"{self.output_path.stem}.related.json")
+
+    def shard_path(self, source: str) -> Path:
+        return self.output_path.with_name(f"{self.output_path.stem}.{source}{self.output_path.suffix}")
+
+    def _files(self) -> list:
+        files = [self.main, *self.shards.values()]
+        if self.ndjson:
+            files.append(self.ndjson)
+        if self.indexes:
+            files.append(self.indexes)
+        if self.related:
+            files.append(self.related)
+        return files
+
+    def write(self, yacht: Yacht):
+        try:
+            record = validate_yacht(yacht).model_dump(mode="json")
+        except ValidationError as e:
+            self.rejected += 1
+            logger.error(f"Invalid yacht {yacht.id}, not exported: {e}")
+            return
+        if self.delta:
+            self.delta.record(record)
+        self.main.write(record)
+        if self.ndjson:
+            self.ndjson.write(record)
+        if self.indexes:
+            self.indexes.write(record)
+        if self.related:
+            self.related.write(record)
+        if self.shard_by_source:
+            source = record["source"]
+            if source not in self.shards:
+                self.shards[source] = JsonExportFile(self.shard_path(source))
+            self.shards[source].write(record)
+
+    @property
+    def count(self) -> int:
+        return self.main.count
+
+    def __enter__(self) -> "YachtExporter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            for f in self._files():
+                f.discard()
+            return False
+
+        files = self._files()
+        # Nothing changed and every file is already in place: keep them as they are
+        self.unchanged = (self.delta is not None and not self.delta.changed
+                          and all(f.out.path.exists() for f in files))
+        for f in files:
+            if self.unchanged:
+                f.discard()
+            else:
+                f.commit()
+        if self.delta:
+            out = AtomicFile(self.manifest_path)
+            out.write(dumps(self.delta.manifest(), indent=True))
+            out.commit()
+        return False
+
+
+def export_for_frontend(yachts: Iterable[Yacht], output_path: Path,
+                        ndjson: bool = False, shard_by_source: bool = False, delta: bool = False,
+                        indexes: bool = False, related: Optional[int] = None) -> int:
+    """Export yachts to JSON for frontend consumption"""
+    with YachtExporter(output_path, ndjson=ndjson, shard_by_source=shard_by_source, delta=delta,
+                       indexes=indexes, related=related) as exporter:
+        for yacht in yachts:
+            exporter.write(yacht)
+
+    if exporter.delta:
+        d = exporter.delta
+        logger.info(f"Delta: {len(d.added)} added, {len(d.removed)} removed, {len(d.updated)} updated "
+                    f"(manifest: {exporter.manifest_path})")
+    if exporter.unchanged:
+        logger.info(f"No changes since the last export, {output_path} left as it is")
+        return exporter.count
+
+    logger.info(f"Exported {exporter.count} yachts to {output_path}"
+                + (f" ({exporter.rejected} failed validation)" if exporter.rejected else ""))
+    return exporter.count
@@ -0,0 +1,84 @@
+"""
+Declarative listing filter, applied as far upstream as possible
+One FilterSpec (statuses, types, length and price bands) is checked at
+three stages, each dropping what it can prove is out:
+
+    list URL    sources that support server-side filters get them as query
+                params (see BaseYachtScraper.apply_list_filters)
+    list card   cards whose status badge, price or length is out of the
+                spec are skipped before their detail page is fetched
+    normalized  every record is checked once more after normalization
+
+A value that is unknown at a stage never rejects a listing there; only the
+final check sees everything, and it keeps listings without a price or
+length (price on request) as well.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from models import ScrapedYachtRaw, Yacht, YachtStatus, YachtType
+
+
+def _value(value) -> Optional[str]:
+    return value.value if isinstance(value, (YachtStatus, YachtType)) else value
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    # Allowed status / type values, None allows all
+    statuses: Optional[frozenset[str]] = frozenset(s.value for s in YachtStatus if s != YachtStatus.SOLD)
+    types: Optional[frozenset[str]] = None
+    min_length_m: Optional[float] = None
+    max_length_m: Optional[float] = None
+    min_price: Optional[int] = None
+    max_price: Optional[int] = None
+
+    @property
+    def restricts(self) -> bool:
+        """Whether the spec can reject anything at all"""
+        return (
+            (self.statuses is not None and not self.statuses >= {s.value for s in YachtStatus})
+            or (self.types is not None and not self.types >= {t.value for t in YachtType})
+            or any(bound is not None for bound in (self.min_length_m, self.max_length_m,
+                                                   self.min_price, self.max_price))
+        )
+
+    def allows(self, status=None, yacht_type=None, length_m: Optional[float] = None,
+               price: Optional[int] = None) -> bool:
+        """False only when a known value is outside the spec"""
+        status, yacht_type = _value(status), _value(yacht_type)
+        if status is not None and self.statuses is not None and status not in self.statuses:
+            return False
+        if yacht_type is not None and self.types is not None and yacht_type not in self.types:
+            return False
+        if length_m is not None:
+            if self.min_length_m is not None and length_m < self.min_length_m:
+                return False
+            if self.max_length_m is not None and length_m > self.max_length_m:
+                return False
+        if price is not None:
+            if self.min_price is not None and price < self.min_price:
+                return False
+            if self.max_price is not None and price > self.max_price:
+                return False
+        return True
+
+    def matches(self, yacht: Yacht) -> bool:
+        """Final check on a normalized yacht"""
+        return self.allows(yacht.status, yacht.yacht_type, yacht.length_m, yacht.price)
+
+    def card_check(self, parsers) -> Callable[[ScrapedYachtRaw], bool]:
+        """Check for list cards using main.py's field parsers.
+
+        Only fields the card actually carries are parsed: a card without a
+        status badge or type is not assumed to be available or OTHER.
+        """
+        def check(card: ScrapedYachtRaw) -> bool:
+            return self.allows(
+                status=parsers.status(card.raw_status) if card.raw_status else None,
+                yacht_type=parsers.yacht_type(card.raw_type, card.raw_name) if card.raw_type else None,
+                length_m=parsers.length(card.raw_length)[0],
+                price=parsers.price(card.raw_price)[0],
+            )
+        return check
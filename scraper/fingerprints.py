@@ -0,0 +1,18 @@
+"""
+List-card fingerprints for incremental crawls
+A card's fingerprint is stored next to the listing in the listing store
+(see ListingStore.get_unchanged); its detail page is only fetched again
+when the fingerprint changed, the stored record is too old, or the boat
+has not been seen before.
+"""
+
+import hashlib
+
+from models import ScrapedYachtRaw
+
+
+def card_fingerprint(card: ScrapedYachtRaw) -> str:
+    """Fingerprint of the fields visible on a listing card (name, price, thumbnail, status badge)"""
+    thumbnail = card.images[0] if card.images else ""
+    key = "\x1f".join([card.raw_name or "", card.raw_price or "", thumbnail, card.raw_status or ""])
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()
@@ -0,0 +1,151 @@
+"""
+Persistent HTTP response cache for the scrapers
+Stores page bodies with their ETag / Last-Modified validators so repeated
+crawls can revalidate with conditional requests instead of re-downloading.
+"""
+
+import sqlite3
+import threading
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+
+class HttpCache:
+    """SQLite-backed response cache with a size cap and LRU eviction"""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = 200 * 1024 * 1024,
+                 default_ttl: Optional[float] = None,
+                 host_ttls: Optional[dict[str, float]] = None):
+        """
+        max_bytes:   total body size kept on disk before least recently used entries are evicted
+        default_ttl: seconds to serve entries without validators without hitting the network
+        host_ttls:   per-host TTL override (seconds), served without revalidation
+        """
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.host_ttls = host_ttls or {}
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_dir / "responses.sqlite3"), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        return CacheEntry(*row) if row else None
+
+    def _ttl_for(self, entry: CacheEntry) -> Optional[float]:
+        host = urlparse(entry.url).netloc
+        if host in self.host_ttls:
+            return self.host_ttls[host]
+        if not entry.has_validators:
+            return self.default_ttl
+        return None
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """True if the entry can be served without contacting the server"""
+        ttl = self._ttl_for(entry)
+        return ttl is not None and time.time() - entry.fetched_at < ttl
+
+    def get_fresh(self, url: str) -> Optional[str]:
+        """Return the cached body if it is still fresh"""
+        entry = self.lookup(url)
+        if entry and self.is_fresh(entry):
+            self.touch(url)
+            self.hits += 1
+            return entry.body
+        return None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[CacheEntry]) -> dict[str, str]:
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def touch(self, url: str, revalidated: bool = False):
+        """Mark an entry as recently used (and refreshed after a 304)"""
+        now = time.time()
+        with self._lock:
+            if revalidated:
+                self.revalidated += 1
+                self._conn.execute(
+                    "UPDATE responses SET last_access = ?, fetched_at = ? WHERE url = ?", (now, now, url)
+                )
+            else:
+                self._conn.execute("UPDATE responses SET last_access = ? WHERE url = ?", (now, url))
+            self._conn.commit()
+
+    def store(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]):
+        now = time.time()
+        size = len(body.encode("utf-8"))
+        with self._lock:
+            self.misses += 1
+            old = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if old:
+                self._total_bytes -= old[0]
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now, now, size),
+            )
+            self._total_bytes += size
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT url, size FROM responses ORDER BY last_access").fetchall()
+        evicted = 0
+        for url, size in rows:
+            if self._total_bytes <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._total_bytes -= size
+            evicted += 1
+        logger.info(f"Evicted {evicted} cached responses ({self._total_bytes} bytes left)")
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,331 @@
+"""
+Image validation and thumbnails
+Image URLs are probed concurrently (a bounded thread pool, with a cap per
+host) by reading only the first bytes of each file, enough to get its
+format and dimensions from the header. Broken links and icon-sized
+images are dropped and the best-sized image becomes the thumbnail.
+
+Probe results are kept in SQLite and revalidated with conditional
+requests, and thumbnails are stored by the SHA-256 of the original, so an
+unchanged image is never downloaded or resized twice. Resizing needs
+Pillow (optional); without it the best original is used as thumbnail.
+"""
+
+import hashlib
+import io
+import logging
+import sqlite3
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+from urllib.parse import urlparse
+
+import requests
+
+from exporter import AtomicFile
+from http_cache import HttpCache
+from metrics import REGISTRY
+from models import Yacht
+from transport import HttpTransport
+
+try:
+    from PIL import Image
+except ImportError:  # optional, needed to write resized thumbnails
+    Image = None
+
+logger = logging.getLogger(__name__)
+
+# Header bytes read per probe, JPEG dimensions can sit behind a large EXIF block
+PROBE_BYTES = 64 * 1024
+# Anything smaller is an icon, logo or spacer
+MIN_WIDTH = 200
+MIN_HEIGHT = 150
+# Width/height ratios outside this range are banners or strips
+MIN_ASPECT = 0.4
+MAX_ASPECT = 3.0
+# Images at least this large are equally good thumbnails, the listing order decides
+TARGET_AREA = 1200 * 800
+
+# Probe results: ok, small (icon-sized), broken (4xx / not an image),
+# error (network or server failure, not persisted so the next run retries)
+OK, SMALL, BROKEN, ERROR = "ok", "small", "broken", "error"
+
+# Content types image_size understands, a header it cannot read means a corrupt file
+MEASURED_TYPES = {"image/jpeg", "image/png", "image/gif", "image/webp"}
+
+
+def image_size(data: bytes) -> Optional[tuple[str, int, int]]:
+    """(format, width, height) from the first bytes of a PNG, GIF, JPEG or WebP file"""
+    if data.startswith(b"\x89PNG\r\n\x1a\n") and len(data) >= 24:
+        width, height = struct.unpack(">II", data[16:24])
+        return "png", width, height
+
+    if data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+        width, height = struct.unpack("<HH", data[6:10])
+        return "gif", width, height
+
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP" and len(data) >= 30:
+        chunk = data[12:16]
+        if chunk == b"VP8 ":
+            width, height = struct.unpack("<HH", data[26:30])
+            return "webp", width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L":
+            b0, b1, b2, b3 = data[21:25]
+            return "webp", 1 + (((b1 & 0x3F) << 8) | b0), 1 + (((b3 & 0x0F) << 10) | (b2 << 2) | (b1 >> 6))
+        if chunk == b"VP8X":
+            return "webp", 1 + int.from_bytes(data[24:27], "little"), 1 + int.from_bytes(data[27:30], "little")
+        return None
+
+    if data[:2] == b"\xff\xd8":
+        i = 2
+        while i + 9 < len(data):
+            if data[i] != 0xFF:
+                return None
+            marker = data[i + 1]
+            if marker == 0xFF:  # fill byte
+                i += 1
+                continue
+            if marker == 0x01 or 0xD0 <= marker <= 0xD8:  # standalone markers
+                i += 2
+                continue
+            # Start of frame (baseline, progressive, ...), not DHT/JPG/DAC
+            if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack(">HH", data[i + 5:i + 9])
+                return "jpeg", width, height
+            i += 2 + struct.unpack(">H", data[i + 2:i + 4])[0]
+    return None
+
+
+@dataclass
+class ImageInfo:
+    url: str
+    status: str
+    format: Optional[str] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    digest: Optional[str] = None  # SHA-256 of the full file, once downloaded for a thumbnail
+    checked_at: float = 0.0
+
+    @property
+    def usable(self) -> bool:
+        """Worth keeping in the gallery (transient errors get the benefit of the doubt)"""
+        return self.status in (OK, ERROR)
+
+    @property
+    def area(self) -> int:
+        return (self.width or 0) * (self.height or 0)
+
+
+class ImageStore:
+    """SQLite store of probe results and content digests, reused across runs"""
+
+    def __init__(self, cache_dir: Path):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(cache_dir / "images.sqlite3"), check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS images (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                format TEXT,
+                width INTEGER,
+                height INTEGER,
+                etag TEXT,
+                last_modified TEXT,
+                digest TEXT,
+                checked_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def lookup(self, url: str) -> Optional[ImageInfo]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT url, status, format, width, height, etag, last_modified, digest, checked_at "
+                "FROM images WHERE url = ?", (url,)
+            ).fetchone()
+        return ImageInfo(*row) if row else None
+
+    def save(self, info: ImageInfo):
+        if info.status == ERROR:
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (info.url, info.status, info.format, info.width, info.height,
+                 info.etag, info.last_modified, info.digest, info.checked_at),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ImagePipeline:
+    """Validates yacht images, picks thumbnails and writes resized copies"""
+
+    def __init__(self, store: ImageStore, transport: HttpTransport, workers: int = 8, per_host: int = 4,
+                 max_age: float = 7 * 24 * 3600, thumbnail_dir: Optional[Path] = None,
+                 thumbnail_url: str = "/thumbs", thumbnail_size: int = 480):
+        """
+        workers:        probes and downloads in flight overall
+        per_host:       probes and downloads in flight per image host
+        max_age:        seconds a stored probe is trusted before it is revalidated
+        thumbnail_dir:  where resized thumbnails are written (None: use the original URL)
+        thumbnail_url:  public URL prefix under which thumbnail_dir is served
+        """
+        self.store = store
+        self.transport = transport
+        self.workers = workers
+        self.per_host = per_host
+        self.max_age = max_age
+        self.thumbnail_dir = thumbnail_dir
+        self.thumbnail_url = thumbnail_url.rstrip("/")
+        self.thumbnail_size = thumbnail_size
+        self._host_slots: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+        if thumbnail_dir and Image is None:
+            logger.warning("Pillow is not installed, thumbnails will link to the original images")
+            self.thumbnail_dir = None
+
+    def _host_slot(self, url: str) -> threading.Semaphore:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_slots:
+                self._host_slots[host] = threading.Semaphore(self.per_host)
+            return self._host_slots[host]
+
+    def probe(self, url: str) -> ImageInfo:
+        """Status and dimensions of one image from its first bytes"""
+        stored = self.store.lookup(url)
+        if stored and time.time() - stored.checked_at < self.max_age:
+            REGISTRY.inc("images_checked_total", result="stored")
+            return stored
+
+        headers = HttpCache.conditional_headers(stored)
+        try:
+            with self._host_slot(url):
+                response, data = self.transport.get_prefix(
+                    url, PROBE_BYTES, source="images", done=lambda d: image_size(d) is not None,
+                    headers=headers, timeout=15,
+                )
+        except requests.RequestException as e:
+            logger.warning(f"Image probe failed for {url}: {e}")
+            REGISTRY.inc("images_checked_total", result=ERROR)
+            return ImageInfo(url, ERROR)
+
+        if stored and response.status_code == 304:
+            stored.checked_at = time.time()
+            self.store.save(stored)
+            REGISTRY.inc("images_checked_total", result="revalidated")
+            return stored
+
+        info = ImageInfo(url, BROKEN, etag=response.headers.get("ETag"),
+                         last_modified=response.headers.get("Last-Modified"), checked_at=time.time())
+        REGISTRY.inc("image_probe_bytes_total", len(data))
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code >= 500 or response.status_code == 429:
+            info.status = ERROR
+        elif response.status_code < 300 and content_type.startswith("image/"):
+            size = image_size(data)
+            if size:
+                info.format, info.width, info.height = size
+                info.status = OK if info.width >= MIN_WIDTH and info.height >= MIN_HEIGHT else SMALL
+            elif content_type.split(";")[0].strip() not in MEASURED_TYPES:
+                # Formats we cannot measure (SVG, AVIF, ...) are kept but never preferred
+                info.status = OK
+        # Same bytes as before: the stored digest still names the thumbnail
+        if stored and stored.digest and info.etag and info.etag == stored.etag:
+            info.digest = stored.digest
+        self.store.save(info)
+        REGISTRY.inc("images_checked_total", result=info.status)
+        return info
+
+    @staticmethod
+    def best_thumbnail(infos: list[ImageInfo]) -> Optional[ImageInfo]:
+        """Largest well-proportioned image, earlier ones win once they are big enough"""
+        candidates = [
+            (min(info.area, TARGET_AREA), -index, info)
+            for index, info in enumerate(infos)
+            if info.status == OK and info.area and MIN_ASPECT <= info.width / info.height <= MAX_ASPECT
+        ]
+        if candidates:
+            return max(candidates, key=lambda c: c[:2])[2]
+        # Nothing measurable: fall back to the first image that is not known to be bad
+        return next((info for info in infos if info.usable), None)
+
+    def _thumbnail_path(self, digest: str) -> Path:
+        return self.thumbnail_dir / digest[:2] / f"{digest}-{self.thumbnail_size}.jpg"
+
+    def thumbnail(self, info: ImageInfo) -> Optional[str]:
+        """Public URL of the resized thumbnail, creating it if this image is new"""
+        if info.digest and self._thumbnail_path(info.digest).exists():
+            REGISTRY.inc("thumbnails_total", result="reused")
+            return self._public_url(info.digest)
+
+        try:
+            with self._host_slot(info.url):
+                response = self.transport.get(info.url, source="images", timeout=30)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.warning(f"Thumbnail download failed for {info.url}: {e}")
+            return None
+
+        info.digest = hashlib.sha256(response.content).hexdigest()
+        self.store.save(info)
+        path = self._thumbnail_path(info.digest)
+        # Another URL may have carried the same file
+        if path.exists():
+            REGISTRY.inc("thumbnails_total", result="reused")
+            return self._public_url(info.digest)
+
+        try:
+            with Image.open(io.BytesIO(response.content)) as img:
+                img.draft("RGB", (self.thumbnail_size, self.thumbnail_size))
+                img.thumbnail((self.thumbnail_size, self.thumbnail_size))
+                buffer = io.BytesIO()
+                img.convert("RGB").save(buffer, "JPEG", quality=82, optimize=True)
+        except Exception as e:
+            logger.warning(f"Could not resize {info.url}: {e}")
+            return None
+
+        out = AtomicFile(path)
+        out.write(buffer.getvalue())
+        out.commit()
+        REGISTRY.inc("thumbnails_total", result="created")
+        return self._public_url(info.digest)
+
+    def _public_url(self, digest: str) -> str:
+        return f"{self.thumbnail_url}/{self._thumbnail_path(digest).relative_to(self.thumbnail_dir).as_posix()}"
+
+    def process(self, yachts: Iterable[Yacht]) -> list[Yacht]:
+        """Yachts with broken and icon-sized images removed and the best thumbnail set"""
+        yachts = list(yachts)
+        urls = list(dict.fromkeys(url for yacht in yachts for url in yacht.images))
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            infos = dict(zip(urls, pool.map(self.probe, urls)))
+
+            best = [self.best_thumbnail([infos[url] for url in yacht.images]) for yacht in yachts]
+            thumbnails: dict[str, Optional[str]] = {}
+            if self.thumbnail_dir:
+                chosen = list({info.url: info for info in best if info and info.status == OK}.values())
+                thumbnails = dict(zip((info.url for info in chosen), pool.map(self.thumbnail, chosen)))
+
+        result = []
+        for yacht, info in zip(yachts, best):
+            thumbnail = (thumbnails.get(info.url) or info.url) if info else None
+            images = [url for url in yacht.images if infos[url].usable]
+            result.append(yacht.model_copy(update={"images": images, "thumbnail": thumbnail}))
+
+        dropped = sum(1 for info in infos.values() if not info.usable)
+        logger.info(f"Images: {len(urls)} checked, {dropped} broken or icon-sized dropped, "
+                    f"{sum(1 for t in thumbnails.values() if t)} thumbnails")
+        return result
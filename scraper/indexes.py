@@ -0,0 +1,115 @@
+"""
+Precomputed lookup indexes for the frontend
+Built from the exported records in the same pass and written next to
+yachts.json as <stem>.index.json, so the site can look a yacht up by id,
+filter by type / status / source / prefecture, show facet counts and sort
+without scanning every record on each call:
+
+    offsets   id -> position in the yachts array
+    by        field -> value -> ids, in export order
+    facets    price / length / year bucket counts
+    sorted    order name -> ids
+
+Records missing a value are left out of that field's index and counted as
+"unknown" in its facet; they sort after every record that has one.
+"""
+
+from bisect import bisect_right
+
+# Inverted indexes; records without the field are not listed
+INDEXED_FIELDS = ("yacht_type", "status", "source", "prefecture")
+
+# Lower bucket edges; the last bucket is open-ended. Prices are compared as
+# stored, whatever their currency (almost all listings are in JPY).
+PRICE_BUCKETS = (0, 1_000_000, 3_000_000, 5_000_000, 10_000_000, 20_000_000, 50_000_000, 100_000_000)
+LENGTH_BUCKETS_M = (0, 6, 8, 10, 12, 15, 20, 30)
+YEAR_BUCKET_SIZE = 5
+
+# facet -> (field, bucket edges); years use fixed-width buckets instead
+FACETS = {
+    "price": ("price", PRICE_BUCKETS),
+    "length": ("length_m", LENGTH_BUCKETS_M),
+    "year": ("year_built", None),
+}
+
+# name -> (field, descending)
+SORT_ORDERS = {
+    "price_asc": ("price", False),
+    "price_desc": ("price", True),
+    "length_desc": ("length_m", True),
+    "year_desc": ("year_built", True),
+    "newest": ("created_at", True),
+    "updated": ("updated_at", True),
+}
+
+
+def _fixed_buckets(values: list, edges: tuple) -> list[dict]:
+    counts = [0] * len(edges)
+    for value in values:
+        counts[max(bisect_right(edges, value) - 1, 0)] += 1
+    return [
+        {"min": low, "max": edges[i + 1] if i + 1 < len(edges) else None, "count": count}
+        for i, (low, count) in enumerate(zip(edges, counts))
+    ]
+
+
+def _year_buckets(values: list) -> list[dict]:
+    counts: dict[int, int] = {}
+    for year in values:
+        low = year - year % YEAR_BUCKET_SIZE
+        counts[low] = counts.get(low, 0) + 1
+    return [{"min": low, "max": low + YEAR_BUCKET_SIZE, "count": counts[low]} for low in sorted(counts)]
+
+
+def _sorted_ids(ids: list[str], values: list, descending: bool) -> list[str]:
+    """Ids ordered by value, ties and missing values in export order"""
+    present = [i for i, value in enumerate(values) if value is not None]
+    # reverse=True keeps the sort stable, ties stay in export order
+    present.sort(key=values.__getitem__, reverse=descending)
+    missing = [i for i, value in enumerate(values) if value is None]
+    return [ids[i] for i in present + missing]
+
+
+class YachtIndex:
+    """Collects the indexed fields of exported records, in export order"""
+
+    def __init__(self):
+        self.ids: list[str] = []
+        self.columns: dict[str, list] = {
+            name: [] for name in {*INDEXED_FIELDS, *(f for f, _ in FACETS.values()), *(f for f, _ in SORT_ORDERS.values())}
+        }
+
+    def add(self, record: dict):
+        self.ids.append(record["id"])
+        for name, column in self.columns.items():
+            value = record.get(name)
+            column.append(None if value == "" else value)
+
+    def build(self) -> dict:
+        offsets = {yacht_id: i for i, yacht_id in enumerate(self.ids)}
+
+        by: dict[str, dict[str, list[str]]] = {}
+        for name in INDEXED_FIELDS:
+            index: dict[str, list[str]] = {}
+            for yacht_id, value in zip(self.ids, self.columns[name]):
+                if value is not None:
+                    index.setdefault(value, []).append(yacht_id)
+            by[name] = dict(sorted(index.items()))
+
+        facets = {}
+        for facet, (name, edges) in FACETS.items():
+            values = [v for v in self.columns[name] if v is not None]
+            buckets = _fixed_buckets(values, edges) if edges else _year_buckets(values)
+            facets[facet] = {"buckets": buckets, "unknown": len(self.ids) - len(values)}
+
+        return {
+            "count": len(self.ids),
+            "offsets": offsets,
+            "by": by,
+            "facets": facets,
+            "sorted": {
+                order: _sorted_ids(self.ids, self.columns[name], descending)
+                for order, (name, descending) in SORT_ORDERS.items()
+            },
+        }
+
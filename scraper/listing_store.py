@@ -0,0 +1,214 @@
+"""
+SQLite listing store
+Keeps every normalized listing across runs, keyed by (source, source_id),
+with a price/status history. created_at / updated_at come from here: a
+listing keeps its first-seen time, and updated_at only moves when its
+content changes. Exports can be served from the store without scraping.
+
+Incremental crawls keep their list-card fingerprints in the same database
+(cards table, see fingerprints.py): a detail page is only fetched again
+when its card changed, the stored raw record is older than card_max_age,
+or the boat has not been seen before.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from enum import Enum
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from models import ScrapedYachtRaw, Yacht, YachtStatus
+
+logger = logging.getLogger(__name__)
+
+# Stored as columns, not part of the record JSON or its content hash
+TIMESTAMP_FIELDS = {"created_at", "updated_at", "last_scraped_at"}
+# Rows per SELECT ... IN (...) lookup, below SQLite's variable limit
+LOOKUP_CHUNK = 500
+
+
+def _value(value):
+    """Enum fields may hold the enum (validated) or its value (trusted records)"""
+    return value.value if isinstance(value, Enum) else value
+
+
+def content_hash(record_json: str) -> str:
+    return hashlib.sha1(record_json.encode("utf-8")).hexdigest()
+
+
+class ListingStore:
+    """Normalized listings plus their price/status history and list-card fingerprints"""
+
+    def __init__(self, path: Path, card_max_age: float = 7 * 24 * 3600):
+        """card_max_age: seconds after which a listing is re-fetched even if its card is unchanged"""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.card_max_age = card_max_age
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS yachts (
+                id TEXT PRIMARY KEY,
+                source TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                price INTEGER,
+                record_json TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                last_scraped_at TEXT NOT NULL
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_yachts_source_id ON yachts (source, source_id);
+            CREATE INDEX IF NOT EXISTS idx_yachts_status ON yachts (status);
+            CREATE INDEX IF NOT EXISTS idx_yachts_last_scraped_at ON yachts (last_scraped_at);
+
+            CREATE TABLE IF NOT EXISTS history (
+                yacht_id TEXT NOT NULL,
+                observed_at TEXT NOT NULL,
+                price INTEGER,
+                status TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_history_yacht ON history (yacht_id, observed_at);
+
+            CREATE TABLE IF NOT EXISTS cards (
+                source TEXT NOT NULL,
+                source_url TEXT NOT NULL,
+                source_id TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                scraped_at REAL NOT NULL,
+                raw_json TEXT NOT NULL,
+                PRIMARY KEY (source, source_url)
+            );
+        """)
+        self._conn.commit()
+
+    def _existing(self, ids: list[str]) -> dict[str, tuple]:
+        rows = {}
+        for i in range(0, len(ids), LOOKUP_CHUNK):
+            chunk = ids[i:i + LOOKUP_CHUNK]
+            rows.update(
+                (row[0], row[1:]) for row in self._conn.execute(
+                    "SELECT id, status, price, content_hash, created_at, updated_at FROM yachts "
+                    f"WHERE id IN ({','.join('?' * len(chunk))})", chunk,
+                )
+            )
+        return rows
+
+    def upsert_many(self, yachts: Iterable[Yacht], scraped_at: Optional[datetime] = None) -> list[Yacht]:
+        """Insert or update a batch in one transaction.
+
+        Returns the yachts with created_at / updated_at / last_scraped_at
+        taken from the store. A history row is added for new listings and
+        whenever the price or status changes.
+        """
+        yachts = list(yachts)
+        now = (scraped_at or datetime.utcnow()).isoformat()
+        rows, history, result = [], [], []
+        added = changed = 0
+
+        with self._lock:
+            existing = self._existing([y.id for y in yachts])
+            for yacht in yachts:
+                record_json = yacht.model_dump_json(exclude=TIMESTAMP_FIELDS, warnings=False)
+                digest = content_hash(record_json)
+                status = _value(yacht.status)
+                old = existing.get(yacht.id)
+                if old is None:
+                    created_at = updated_at = now
+                    history.append((yacht.id, now, yacht.price, status))
+                    added += 1
+                else:
+                    old_status, old_price, old_hash, created_at, updated_at = old
+                    if old_hash != digest:
+                        updated_at = now
+                        changed += 1
+                    if old_status != status or old_price != yacht.price:
+                        history.append((yacht.id, now, yacht.price, status))
+                # Later duplicates within the batch see this version
+                existing[yacht.id] = (status, yacht.price, digest, created_at, updated_at)
+
+                rows.append((yacht.id, _value(yacht.source), yacht.id, status, yacht.price, record_json, digest,
+                             created_at, updated_at, now))
+                result.append(yacht.model_copy(update={
+                    "created_at": datetime.fromisoformat(created_at),
+                    "updated_at": datetime.fromisoformat(updated_at),
+                    "last_scraped_at": datetime.fromisoformat(now),
+                }))
+
+            with self._conn:
+                self._conn.executemany("""
+                    INSERT INTO yachts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (id) DO UPDATE SET
+                        status = excluded.status, price = excluded.price,
+                        record_json = excluded.record_json, content_hash = excluded.content_hash,
+                        updated_at = excluded.updated_at, last_scraped_at = excluded.last_scraped_at
+                """, rows)
+                self._conn.executemany("INSERT INTO history VALUES (?, ?, ?, ?)", history)
+
+        logger.info(f"Listing store: {len(yachts)} upserted ({added} new, {changed} changed, "
+                    f"{len(history)} history entries)")
+        return result
+
+    def iter_yachts(self, max_age: Optional[float] = None, include_sold: bool = False) -> Iterator[Yacht]:
+        """Stored listings, optionally only those scraped within max_age seconds"""
+        query = "SELECT record_json, created_at, updated_at, last_scraped_at FROM yachts WHERE 1 = 1"
+        params: list = []
+        if not include_sold:
+            query += " AND status != ?"
+            params.append(YachtStatus.SOLD.value)
+        if max_age is not None:
+            query += " AND last_scraped_at >= ?"
+            params.append((datetime.utcnow() - timedelta(seconds=max_age)).isoformat())
+        query += " ORDER BY source, id"
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for record_json, created_at, updated_at, last_scraped_at in rows:
+            yield Yacht.trusted(
+                **json.loads(record_json),
+                created_at=datetime.fromisoformat(created_at),
+                updated_at=datetime.fromisoformat(updated_at),
+                last_scraped_at=datetime.fromisoformat(last_scraped_at),
+            )
+
+    def history(self, yacht_id: str) -> list[dict]:
+        """Price/status changes of one listing, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT observed_at, price, status FROM history WHERE yacht_id = ? ORDER BY observed_at",
+                (yacht_id,),
+            ).fetchall()
+        return [{"observed_at": observed_at, "price": price, "status": status} for observed_at, price, status in rows]
+
+    def get_unchanged(self, source: str, source_url: str, fingerprint: str) -> Optional[ScrapedYachtRaw]:
+        """Stored raw record if the listing card is unchanged and the record is recent enough"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fingerprint, scraped_at, raw_json FROM cards WHERE source = ? AND source_url = ?",
+                (source, source_url),
+            ).fetchone()
+        if not row:
+            return None
+
+        stored_fingerprint, scraped_at, raw_json = row
+        if stored_fingerprint != fingerprint or time.time() - scraped_at > self.card_max_age:
+            return None
+        return ScrapedYachtRaw.model_validate_json(raw_json)
+
+    def save(self, source: str, source_url: str, fingerprint: str, raw: ScrapedYachtRaw):
+        """Remember a listing card's fingerprint and the raw record scraped for it"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cards VALUES (?, ?, ?, ?, ?, ?)",
+                (source, source_url, raw.source_id, fingerprint, time.time(), raw.model_dump_json()),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -4,16 +4,35 @@ Main scraper script for Avisail Yachts
 Scrapes Japanese yacht sales websites and exports data for frontend
 """
 
-import json
 import argparse
+import asyncio
 import logging
+import time
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import replace
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from functools import lru_cache
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
 import re
 
-from sources import AokiYachtScraper, BoatWorldScraper, ChukoteiScraper
+from sources import AokiYachtScraper, BaseYachtScraper, BoatWorldScraper, ChukoteiScraper, ItemBudget
 from models import ScrapedYachtRaw, Yacht, YachtSource, YachtType, YachtStatus, Currency
+from http_cache import HttpCache
+from exporter import AtomicFile, dumps, export_for_frontend
+from rate_limit import RateLimiter
+from retry import CircuitBreaker, RetryPolicy
+from transport import HttpTransport
+from archive import PageArchive
+from metrics import REGISTRY
+from dedup import DEFAULT_THRESHOLD, dedupe_yachts
+from images import ImagePipeline, ImageStore
+from listing_store import ListingStore
+from related import DEFAULT_LIMIT as RELATED_LIMIT
+from filters import FilterSpec
+from checkpoint import CheckpointJournal
 
 logging.basicConfig(
     level=logging.INFO,
@@ -21,6 +40,34 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SCRAPERS = {
+    "aoki": AokiYachtScraper,
+    "boatworld": BoatWorldScraper,
+    "chukotei": ChukoteiScraper,
+}
+
+# Patterns used by the field parsers, compiled once
+PRICE_MAN_RE = re.compile(r"([\d.]+)万")
+PRICE_YEN_RE = re.compile(r"([\d]+)円")
+PRICE_NUM_RE = re.compile(r"([\d]+)")
+LENGTH_FT_RE = re.compile(r"([\d.]+)\s*(?:ft|フィート|')", re.IGNORECASE)
+LENGTH_M_RE = re.compile(r"([\d.]+)\s*m", re.IGNORECASE)
+LENGTH_NUM_RE = re.compile(r"([\d.]+)")
+YEAR_RE = re.compile(r"(\d{4})")
+HORSEPOWER_RE = re.compile(r"(\d+)")
+
+# Keyword tables for parse_yacht_type, checked in order
+YACHT_TYPE_KEYWORDS = [
+    (YachtType.SAILING, ("sailing", "ヨット", "セーリング", "帆")),
+    (YachtType.CATAMARAN, ("catamaran", "カタマラン", "双胴")),
+    (YachtType.SPORTFISH, ("sportfish", "フィッシング", "釣")),
+    (YachtType.CRUISER, ("cruiser", "クルーザー")),
+    (YachtType.MOTOR, ("motor", "モーター", "パワー")),
+]
+
+# Max distinct raw strings memoized per field parser in normalize_batch
+PARSE_CACHE_SIZE = 8192
+
 
 def parse_price(raw_price: Optional[str]) -> tuple[Optional[int], Currency]:
     """Parse price string to integer value and currency"""
@@ -31,18 +78,18 @@ def parse_price(raw_price: Optional[str]) -> tuple[Optional[int], Currency]:
     clean = raw_price.replace(",", "").replace(" ", "")
 
     # Check for 万円 (10,000 yen units)
-    man_match = re.search(r"([\d.]+)万", clean)
+    man_match = PRICE_MAN_RE.search(clean)
     if man_match:
         value = float(man_match.group(1))
         return int(value * 10000), Currency.JPY
 
     # Check for regular yen
-    yen_match = re.search(r"([\d]+)円", clean)
+    yen_match = PRICE_YEN_RE.search(clean)
     if yen_match:
         return int(yen_match.group(1)), Currency.JPY
 
     # Just numbers
-    num_match = re.search(r"([\d]+)", clean)
+    num_match = PRICE_NUM_RE.search(clean)
     if num_match:
         value = int(num_match.group(1))
         # If small number, probably in 万円
@@ -59,21 +106,21 @@ def parse_length(raw_length: Optional[str]) -> tuple[Optional[float], Optional[f
         return None, None
 
     # Check for feet
-    ft_match = re.search(r"([\d.]+)\s*(?:ft|フィート|')", raw_length, re.IGNORECASE)
+    ft_match = LENGTH_FT_RE.search(raw_length)
     if ft_match:
         ft = float(ft_match.group(1))
         m = ft * 0.3048
         return round(m, 2), round(ft, 1)
 
     # Check for meters
-    m_match = re.search(r"([\d.]+)\s*m", raw_length, re.IGNORECASE)
+    m_match = LENGTH_M_RE.search(raw_length)
     if m_match:
         m = float(m_match.group(1))
         ft = m / 0.3048
         return round(m, 2), round(ft, 1)
 
     # Just numbers
-    num_match = re.search(r"([\d.]+)", raw_length)
+    num_match = LENGTH_NUM_RE.search(raw_length)
     if num_match:
         value = float(num_match.group(1))
         # Assume feet if > 10, meters if <= 10
@@ -93,7 +140,7 @@ def parse_year(raw_year: Optional[str]) -> Optional[int]:
     if not raw_year:
         return None
 
-    match = re.search(r"(\d{4})", raw_year)
+    match = YEAR_RE.search(raw_year)
     if match:
         year = int(match.group(1))
         if 1950 <= year <= 2030:
@@ -106,7 +153,7 @@ def parse_horsepower(raw_hp: Optional[str]) -> Optional[int]:
     if not raw_hp:
         return None
 
-    match = re.search(r"(\d+)", raw_hp)
+    match = HORSEPOWER_RE.search(raw_hp)
     if match:
         return int(match.group(1))
     return None
@@ -116,16 +163,9 @@ def parse_yacht_type(raw_type: Optional[str], raw_name: str) -> YachtType:
     """Determine yacht type from raw data"""
     combined = f"{raw_type or ''} {raw_name}".lower()
 
-    if any(x in combined for x in ["sailing", "ヨット", "セーリング", "帆"]):
-        return YachtType.SAILING
-    if any(x in combined for x in ["catamaran", "カタマラン", "双胴"]):
-        return YachtType.CATAMARAN
-    if any(x in combined for x in ["sportfish", "フィッシング", "釣"]):
-        return YachtType.SPORTFISH
-    if any(x in combined for x in ["cruiser", "クルーザー"]):
-        return YachtType.CRUISER
-    if any(x in combined for x in ["motor", "モーター", "パワー"]):
-        return YachtType.MOTOR
+    for yacht_type, keywords in YACHT_TYPE_KEYWORDS:
+        if any(x in combined for x in keywords):
+            return yacht_type
 
     return YachtType.OTHER
 
@@ -146,14 +186,32 @@ def parse_status(raw_status: Optional[str]) -> YachtStatus:
     return YachtStatus.AVAILABLE
 
 
-def normalize_yacht(raw: ScrapedYachtRaw) -> Yacht:
-    """Normalize raw scraped data to Yacht model"""
-    price, currency = parse_price(raw.raw_price)
-    length_m, length_ft = parse_length(raw.raw_length)
-    year = parse_year(raw.raw_year)
-    hp = parse_horsepower(raw.raw_horsepower)
-    yacht_type = parse_yacht_type(raw.raw_type, raw.raw_name)
-    status = parse_status(raw.raw_status)
+class FieldParsers(NamedTuple):
+    """Set of field parsers used by normalize_yacht"""
+    price: Callable
+    length: Callable
+    year: Callable
+    horsepower: Callable
+    yacht_type: Callable
+    status: Callable
+
+
+PARSERS = FieldParsers(parse_price, parse_length, parse_year, parse_horsepower, parse_yacht_type, parse_status)
+
+
+def memoized_parsers(maxsize: int = PARSE_CACHE_SIZE) -> FieldParsers:
+    """Field parsers memoized in bounded LRU caches keyed by the raw strings"""
+    return FieldParsers(*(lru_cache(maxsize=maxsize)(parser) for parser in PARSERS))
+
+
+def normalize_fields(raw: ScrapedYachtRaw, parsers: FieldParsers = PARSERS) -> dict:
+    """Normalized Yacht field values for a raw record (enums as their values)"""
+    price, currency = parsers.price(raw.raw_price)
+    length_m, length_ft = parsers.length(raw.raw_length)
+    year = parsers.year(raw.raw_year)
+    hp = parsers.horsepower(raw.raw_horsepower)
+    yacht_type = parsers.yacht_type(raw.raw_type, raw.raw_name)
+    status = parsers.status(raw.raw_status)
 
     # Generate name from maker + model if name is empty
     name = raw.raw_name.strip() if raw.raw_name else ""
@@ -165,16 +223,16 @@ def normalize_yacht(raw: ScrapedYachtRaw) -> Yacht:
             parts.append(raw.raw_model)
         name = " ".join(parts) if parts else f"Yacht {raw.source_id}"
 
-    return Yacht(
+    return dict(
         id=raw.source_id,
-        source=raw.source,
+        source=YachtSource(raw.source).value,
         source_url=raw.source_url,
         name=name,
-        yacht_type=yacht_type,
+        yacht_type=yacht_type.value,
         maker=raw.raw_maker,
         model=raw.raw_model,
         price=price,
-        price_currency=currency,
+        price_currency=currency.value,
         price_negotiable=bool(raw.raw_price and ("相談" in raw.raw_price or "応相談" in raw.raw_price)),
         length_m=length_m,
         length_ft=length_ft,
@@ -186,75 +244,460 @@ def normalize_yacht(raw: ScrapedYachtRaw) -> Yacht:
         location=raw.raw_location or "",
         images=raw.images,
         thumbnail=raw.images[0] if raw.images else None,
-        status=status,
+        status=status.value,
     )
 
 
-def export_for_frontend(yachts: list[Yacht], output_path: Path):
-    """Export yachts to JSON for frontend consumption"""
-    data = {
-        "yachts": [y.model_dump() for y in yachts],
-        "meta": {
-            "count": len(yachts),
-            "scraped_at": datetime.utcnow().isoformat(),
-            "sources": list(set(y.source for y in yachts)),
-        }
+def normalize_yacht(raw: ScrapedYachtRaw, parsers: FieldParsers = PARSERS,
+                    now: Optional[datetime] = None) -> Yacht:
+    """Normalize raw scraped data to Yacht model.
+
+    The Yacht is built with Yacht.trusted, without validation; the
+    exporter validates every record once on the way out.
+    """
+    now = now or datetime.utcnow()
+    return Yacht.trusted(**normalize_fields(raw, parsers), created_at=now, updated_at=now, last_scraped_at=now)
+
+
+def normalize_stream(raws: Iterable[ScrapedYachtRaw], parsers: Optional[FieldParsers] = None) -> Iterator[Yacht]:
+    """Normalize records one at a time, reusing parsed values for repeated raw strings.
+
+    Produces the same Yachts as calling normalize_yacht per record. Records
+    that fail to normalize are logged and skipped.
+    """
+    parsers = parsers or memoized_parsers()
+    # One timestamp for the whole run instead of three per record
+    now = datetime.utcnow()
+    for raw in raws:
+        try:
+            with REGISTRY.time("normalize_seconds", source=YachtSource(raw.source).value):
+                yacht = normalize_yacht(raw, parsers, now)
+        except Exception as e:
+            logger.error(f"Error normalizing yacht {raw.source_id}: {e}")
+            continue
+        yield yacht
+
+
+def normalize_batch(raws: list[ScrapedYachtRaw], parsers: Optional[FieldParsers] = None) -> list[Yacht]:
+    """Normalize many records (see normalize_stream)"""
+    return list(normalize_stream(raws, parsers))
+
+
+def counted(items: Iterable, counts: Counter, key: Callable) -> Iterator:
+    """Pass items through, counting them by key"""
+    for item in items:
+        counts[key(item)] += 1
+        yield item
+
+
+def write_run_report(path: Path, started_at: datetime, duration: float, scraped_counts: Counter,
+                     exported_counts: Counter, rate_limiter: RateLimiter, transport: HttpTransport):
+    """Write the JSON run report: per-source counts plus every recorded metric"""
+    report = {
+        "started_at": started_at.isoformat(),
+        "duration_seconds": round(duration, 3),
+        "sources": {
+            source: {
+                "scraped": scraped_counts[source],
+                "exported": exported_counts[source],
+                "detail_fetches_avoided": int(REGISTRY.counter_value("detail_fetches_avoided_total", source=source)),
+            }
+            for source in sorted(scraped_counts | exported_counts)
+        },
+        "rate_limits": rate_limiter.rates(),
+        "transport": transport.stats(),
+        "metrics": REGISTRY.snapshot(),
     }
+    out = AtomicFile(path)
+    out.write(dumps(report, indent=2))
+    out.commit()
+    logger.info(f"Wrote run report to {path}")
+
+
+def build_filter_spec(args: argparse.Namespace) -> FilterSpec:
+    """Listing filter from the CLI options, by default everything but sold yachts"""
+    spec = FilterSpec(
+        types=frozenset(args.types) if args.types else None,
+        min_length_m=args.min_length,
+        max_length_m=args.max_length,
+        min_price=args.min_price,
+        max_price=args.max_price,
+    )
+    if args.statuses:
+        spec = replace(spec, statuses=frozenset(args.statuses))
+    return spec
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+def keep_matching(yachts: Iterable[Yacht], spec: FilterSpec) -> Iterator[Yacht]:
+    """Final filter stage, after normalization"""
+    for yacht in yachts:
+        if spec.matches(yacht):
+            yield yacht
+        else:
+            REGISTRY.inc("filtered_total", source=yacht.source, stage="normalized")
 
-    logger.info(f"Exported {len(yachts)} yachts to {output_path}")
 
+def build_cache(args: argparse.Namespace) -> Optional[HttpCache]:
+    """Create the on-disk response cache from the CLI options"""
+    if not args.cache_dir:
+        return None
 
-def main():
-    parser = argparse.ArgumentParser(description="Scrape Japanese yacht sales websites")
-    parser.add_argument("--source", choices=["aoki", "boatworld", "chukotei", "all"], default="all")
-    parser.add_argument("--max-items", type=int, default=20, help="Max items per source")
-    parser.add_argument("--output", type=Path, default=Path("../src/data/yachts.json"))
-    args = parser.parse_args()
+    host_ttls = {}
+    for item in args.cache_ttl:
+        host, _, seconds = item.partition("=")
+        host_ttls[host] = float(seconds)
 
-    scrapers = {
-        "aoki": AokiYachtScraper,
-        "boatworld": BoatWorldScraper,
-        "chukotei": ChukoteiScraper,
-    }
+    return HttpCache(
+        args.cache_dir,
+        max_bytes=args.cache_max_mb * 1024 * 1024,
+        default_ttl=args.cache_default_ttl,
+        host_ttls=host_ttls,
+    )
 
-    all_raw: list[ScrapedYachtRaw] = []
 
-    if args.source == "all":
-        sources = list(scrapers.keys())
+class SharedResources(NamedTuple):
+    """Resources main.py shares between the source scrapers of one run"""
+    deadline: Optional[float] = None  # time.monotonic() timestamp, parallel runs
+    budget: Optional[ItemBudget] = None  # shared item budget, parallel runs
+    cache: Optional[HttpCache] = None
+    fingerprints: Optional[ListingStore] = None  # --incremental, the --store database
+    rate_limiter: Optional[RateLimiter] = None
+    transport: Optional[HttpTransport] = None
+    archive: Optional[PageArchive] = None
+    filters: Optional[FilterSpec] = None
+    checkpoint: Optional[CheckpointJournal] = None
+
+
+def configure_scraper(source_name: str, args: argparse.Namespace,
+                      shared: SharedResources = SharedResources()) -> BaseYachtScraper:
+    """Create a source scraper set up with the CLI options"""
+    scraper = SCRAPERS[source_name]()
+    scraper.max_concurrency = args.concurrency
+    scraper.deadline = shared.deadline
+    scraper.budget = shared.budget
+    scraper.cache = shared.cache
+    scraper.fingerprints = shared.fingerprints
+    scraper.mode = args.mode
+    scraper.retry_policy = RetryPolicy(max_attempts=args.retries + 1)
+    scraper.circuit_breaker = CircuitBreaker(failure_threshold=args.breaker_threshold)
+    if shared.rate_limiter:
+        scraper.rate_limiter = shared.rate_limiter
+    if shared.transport:
+        scraper.transport = shared.transport
+    scraper.archive = shared.archive
+    if args.parser:
+        scraper.parser_backend = args.parser
+    if shared.filters:
+        scraper.filters = shared.filters
+        # Only worth parsing list cards for when there is a card to check and
+        # something to check on it
+        if shared.filters.restricts and scraper.parses_cards:
+            scraper.card_filter = shared.filters.card_check(memoized_parsers())
+    scraper.checkpoint = shared.checkpoint
+    return scraper
+
+
+def log_scraper_stats(source_name: str, scraper: BaseYachtScraper):
+    if scraper.fingerprints:
+        logger.info(f"[{source_name}] Skipped {scraper.skipped_unchanged} unchanged detail pages")
+    if scraper.card_filter:
+        logger.info(f"[{source_name}] Skipped {scraper.skipped_filtered} listings filtered out on the list page")
+    if scraper.circuit_breaker.fast_failed:
+        logger.warning(f"[{source_name}] {scraper.circuit_breaker.fast_failed} requests failed fast (circuit open)")
+    scraper.rate_limiter.log_rates()
+
+
+def scrape_source(source_name: str, args: argparse.Namespace,
+                  shared: SharedResources = SharedResources()) -> list[ScrapedYachtRaw]:
+    """Run a single source scraper with the CLI options"""
+    logger.info(f"Starting scrape of {source_name}...")
+    scraper = configure_scraper(source_name, args, shared)
+
+    if args.use_async:
+        raw_yachts = asyncio.run(scraper.scrape_all_async(max_items=args.max_items))
+    elif args.pipeline:
+        raw_yachts = scraper.scrape_all_pipelined(max_items=args.max_items, workers=args.parse_workers)
     else:
-        sources = [args.source]
+        raw_yachts = scraper.scrape_all(max_items=args.max_items)
+
+    log_scraper_stats(source_name, scraper)
+    return raw_yachts
+
 
+def stream_raw(sources: list[str], args: argparse.Namespace,
+               shared: SharedResources = SharedResources()) -> Iterator[ScrapedYachtRaw]:
+    """Scrape the sources one after another, yielding records as they are parsed"""
     for source_name in sources:
         logger.info(f"Starting scrape of {source_name}...")
-        scraper = scrapers[source_name]()
-
+        scraper = configure_scraper(source_name, args, shared)
+        count = 0
         try:
-            raw_yachts = scraper.scrape_all(max_items=args.max_items)
-            all_raw.extend(raw_yachts)
-            logger.info(f"Scraped {len(raw_yachts)} yachts from {source_name}")
+            if args.pipeline:
+                raws = scraper.iter_yachts_pipelined(max_items=args.max_items, workers=args.parse_workers)
+            else:
+                raws = scraper.iter_yachts(max_items=args.max_items)
+            for raw in raws:
+                count += 1
+                yield raw
         except Exception as e:
             logger.error(f"Error scraping {source_name}: {e}")
+        log_scraper_stats(source_name, scraper)
+        logger.info(f"Scraped {count} yachts from {source_name}")
 
-    # Normalize all yachts
-    yachts = []
-    for raw in all_raw:
-        try:
-            yacht = normalize_yacht(raw)
-            # Skip sold yachts
-            if yacht.status != YachtStatus.SOLD:
-                yachts.append(yacht)
-        except Exception as e:
-            logger.error(f"Error normalizing yacht {raw.source_id}: {e}")
 
-    logger.info(f"Total available yachts: {len(yachts)}")
+def scrape_sources_parallel(sources: list[str], args: argparse.Namespace,
+                            shared: SharedResources = SharedResources()) -> list[ScrapedYachtRaw]:
+    """Run each source in its own worker thread and merge results as they finish"""
+    shared = shared._replace(
+        deadline=time.monotonic() + args.deadline if args.deadline else None,
+        budget=ItemBudget(args.max_total) if args.max_total else None,
+    )
+    all_raw: list[ScrapedYachtRaw] = []
+
+    with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+        futures = {
+            executor.submit(scrape_source, source_name, args, shared): source_name
+            for source_name in sources
+        }
+        for future in as_completed(futures):
+            source_name = futures[future]
+            try:
+                raw_yachts = future.result()
+                all_raw.extend(raw_yachts)
+                logger.info(f"Scraped {len(raw_yachts)} yachts from {source_name}")
+            except Exception as e:
+                logger.error(f"Error scraping {source_name}: {e}")
+
+    return all_raw
 
-    # Export for frontend
-    export_for_frontend(yachts, args.output)
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape Japanese yacht sales websites")
+    parser.add_argument("--source", choices=["aoki", "boatworld", "chukotei", "all"], default="all")
+    parser.add_argument("--max-items", type=int, default=20, help="Max items per source")
+    parser.add_argument("--output", type=Path, default=Path("../src/data/yachts.json"))
+    parser.add_argument("--ndjson", action="store_true", help="Also write an NDJSON file next to --output")
+    parser.add_argument("--shard-by-source", action="store_true",
+                        help="Also write one <output>.<source>.json file per source")
+    parser.add_argument("--delta", action="store_true",
+                        help="Write <output>.changes.json against the previous export and leave the files "
+                             "untouched when nothing changed")
+    parser.add_argument("--indexes", action="store_true",
+                        help="Also write <output>.index.json: id offsets, type/status/source/prefecture "
+                             "indexes, facet counts and pre-sorted id lists")
+    parser.add_argument("--related", type=int, nargs="?", const=RELATED_LIMIT, default=None, metavar="K",
+                        help=f"Also write <output>.related.json with the top K related yachts of each yacht "
+                             f"(default K: {RELATED_LIMIT}; uses NumPy when installed)")
+    parser.add_argument("--mode", choices=["full", "list-only", "hybrid"], default="full",
+                        help="full: every detail page, list-only: list cards only, "
+                             "hybrid: list cards plus detail pages for missing fields")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="Use the asyncio fetch engine (overlapping polite delays)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Max in-flight requests per host (--async)")
+    parser.add_argument("--parser", choices=["bs4", "lxml"], help="Parser backend for detail pages")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Fetch on one thread and parse detail pages in a process pool")
+    parser.add_argument("--parse-workers", type=int, help="Parse processes for --pipeline (default: CPU count)")
+    parser.add_argument("--parallel", action="store_true", help="Scrape all sources concurrently, one worker per source")
+    parser.add_argument("--stream", action="store_true",
+                        help="Scrape, normalize and export one record at a time with flat memory; "
+                             "skips dedup (needs every record at once)")
+    parser.add_argument("--deadline", type=float, help="Global deadline in seconds for --parallel runs")
+    parser.add_argument("--max-total", type=int, help="Item budget shared by all sources in --parallel runs")
+    parser.add_argument("--cache-dir", type=Path, help="Enable the on-disk HTTP cache in this directory")
+    parser.add_argument("--cache-max-mb", type=int, default=200, help="HTTP cache size cap in MB")
+    parser.add_argument("--cache-default-ttl", type=float,
+                        help="Seconds to reuse cached pages that have no ETag/Last-Modified")
+    parser.add_argument("--cache-ttl", action="append", default=[], metavar="HOST=SECONDS",
+                        help="Per-host TTL override, served without revalidation")
+    parser.add_argument("--max-rate", type=float, default=4.0,
+                        help="Upper bound for the adaptive per-host request rate (req/s)")
+    parser.add_argument("--retries", type=int, default=2, help="Retries for transient fetch failures")
+    parser.add_argument("--breaker-threshold", type=int, default=5,
+                        help="Consecutive failures before a host's circuit breaker opens")
+    archive_group = parser.add_mutually_exclusive_group()
+    archive_group.add_argument("--record", type=Path, metavar="ARCHIVE",
+                               help="Save every fetched page to a .jsonl.gz archive")
+    archive_group.add_argument("--replay", type=Path, metavar="ARCHIVE",
+                               help="Serve pages from an archive instead of the network")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-fetch detail pages whose listing card changed (fingerprints kept in --store)")
+    parser.add_argument("--max-age-days", type=float, default=7,
+                        help="Re-fetch unchanged listings older than this (--incremental)")
+    parser.add_argument("--store", type=Path, metavar="DB",
+                        help="SQLite listing store: keeps listings across runs with price/status history "
+                             "and exports everything recently seen")
+    parser.add_argument("--store-max-age-days", type=float, default=30,
+                        help="Leave stored listings not scraped for this long out of the export (--store)")
+    parser.add_argument("--from-store", action="store_true", help="Export from --store without scraping")
+    parser.add_argument("--history", metavar="YACHT_ID", help="Print the price/status history of a listing (--store)")
+    parser.add_argument("--no-dedup", dest="dedup", action="store_false",
+                        help="Keep listings of the same boat from different sources as separate yachts")
+    parser.add_argument("--dedup-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Similarity score (0-1) above which listings are treated as the same boat")
+    parser.add_argument("--validate-images", action="store_true",
+                        help="Drop broken/icon-sized images and pick each thumbnail by its dimensions")
+    parser.add_argument("--image-cache", type=Path, default=Path(".cache/images"),
+                        help="Directory of the image probe store reused across runs (--validate-images)")
+    parser.add_argument("--image-workers", type=int, default=8, help="Image checks in flight (--validate-images)")
+    parser.add_argument("--image-max-age-days", type=float, default=7,
+                        help="Re-check stored images older than this (--validate-images)")
+    parser.add_argument("--thumbnail-dir", type=Path,
+                        help="Write resized thumbnails here, e.g. ../public/thumbs (needs Pillow)")
+    parser.add_argument("--thumbnail-url", default="/thumbs", help="Public URL prefix of --thumbnail-dir")
+    parser.add_argument("--thumbnail-size", type=int, default=480, help="Thumbnail bounding box in pixels")
+    parser.add_argument("--status", dest="statuses", nargs="+", choices=[s.value for s in YachtStatus],
+                        help="Only export these statuses (default: all but sold)")
+    parser.add_argument("--type", dest="types", nargs="+", choices=[t.value for t in YachtType],
+                        help="Only export these yacht types")
+    parser.add_argument("--min-length", type=float, metavar="M", help="Only export yachts at least this long (m)")
+    parser.add_argument("--max-length", type=float, metavar="M", help="Only export yachts at most this long (m)")
+    parser.add_argument("--min-price", type=int, metavar="JPY", help="Only export yachts priced at least this")
+    parser.add_argument("--max-price", type=int, metavar="JPY", help="Only export yachts priced at most this")
+    parser.add_argument("--checkpoint", type=Path, metavar="PATH",
+                        help="Journal scraped records here so an interrupted run can be resumed")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue from the --checkpoint journal instead of starting over")
+    parser.add_argument("--report", type=Path, metavar="PATH", help="Write a JSON run report with per-stage metrics")
+    parser.add_argument("--prometheus", type=Path, metavar="PATH",
+                        help="Write run metrics in the Prometheus text format (textfile collector)")
+    args = parser.parse_args()
+    if (args.from_store or args.history) and not args.store:
+        parser.error("--from-store and --history need --store")
+    if args.incremental and not args.store:
+        parser.error("--incremental needs --store")
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint")
+    if args.stream:
+        batch_only = [flag for flag, used in (("--store", args.store), ("--validate-images", args.validate_images),
+                                              ("--parallel", args.parallel), ("--async", args.use_async)) if used]
+        if batch_only:
+            parser.error(f"--stream cannot be combined with {', '.join(batch_only)}")
+
+    if args.history:
+        listing_store = ListingStore(args.store)
+        for entry in listing_store.history(args.history):
+            print(f"{entry['observed_at']}  {entry['status']:<12} {entry['price']}")
+        listing_store.close()
+        return
+
+    started_at = datetime.now()
+    run_start = time.monotonic()
+
+    cache = build_cache(args)
+    rate_limiter = RateLimiter(max_rate=args.max_rate)
+    transport = HttpTransport(pool_maxsize=max(args.concurrency, 1))
+    archive = None
+    if args.record:
+        archive = PageArchive(args.record, mode="record")
+    elif args.replay:
+        archive = PageArchive(args.replay, mode="replay")
+    listing_store = ListingStore(args.store, card_max_age=args.max_age_days * 24 * 3600) if args.store else None
+    fingerprints = listing_store if args.incremental else None
+    journal = CheckpointJournal(args.checkpoint, resume=args.resume) if args.checkpoint else None
+
+    scraped_counts: Counter = Counter()
+    exported_counts: Counter = Counter()
+
+    spec = build_filter_spec(args)
+    # The store has to see every listing to notice it was sold or repriced
+    # out of range, so with --store the spec is only applied after normalization
+    upstream = None if args.store else spec
+    shared = SharedResources(cache=cache, fingerprints=fingerprints, rate_limiter=rate_limiter, transport=transport,
+                             archive=archive, filters=upstream, checkpoint=journal)
+
+    if args.from_store:
+        sources = []
+    elif args.source == "all":
+        sources = list(SCRAPERS.keys())
+    else:
+        sources = [args.source]
+
+    def close_shared():
+        transport.log_stats()
+        if archive:
+            archive.close()
+        if cache:
+            logger.info(f"HTTP cache: {cache.hits} fresh hits, {cache.revalidated} revalidated (304), "
+                        f"{cache.misses} downloaded")
+            cache.close()
+        if journal:
+            journal.flush()
+
+    if args.stream:
+        # scrape -> normalize -> filter spec -> export, one record at a time: nothing
+        # is collected, and records reach the export file while the crawl runs
+        raw_stream = stream_raw(sources, args, shared)
+        raw_stream = counted(raw_stream, scraped_counts, lambda raw: raw.source.value)
+        yachts = keep_matching(normalize_stream(raw_stream), spec)
+    else:
+        all_raw: list[ScrapedYachtRaw] = []
+        if args.parallel and sources:
+            all_raw = scrape_sources_parallel(sources, args, shared)
+        else:
+            for source_name in sources:
+                try:
+                    raw_yachts = scrape_source(source_name, args, shared)
+                    all_raw.extend(raw_yachts)
+                    logger.info(f"Scraped {len(raw_yachts)} yachts from {source_name}")
+                except Exception as e:
+                    logger.error(f"Error scraping {source_name}: {e}")
+
+        close_shared()
+        scraped_counts.update(raw.source.value for raw in all_raw)
+        yachts = normalize_batch(all_raw)
+        del all_raw
+
+        if listing_store:
+            # Record this run (sold listings included, for the history) and
+            # export every listing seen recently, not only this run's
+            with REGISTRY.time("store_seconds"):
+                listing_store.upsert_many(yachts)
+                # Sold rows are left in SQL only when the spec drops them anyway
+                yachts = list(listing_store.iter_yachts(max_age=args.store_max_age_days * 24 * 3600,
+                                                        include_sold=spec.allows(status=YachtStatus.SOLD)))
+            listing_store.close()
+
+        # Skip sold yachts and anything else outside the filter spec
+        yachts = list(keep_matching(yachts, spec))
+
+        # Merge the same boat listed by several sources
+        if args.dedup:
+            with REGISTRY.time("dedup_seconds"):
+                yachts = dedupe_yachts(yachts, args.dedup_threshold)
+
+        logger.info(f"Total available yachts: {len(yachts)}")
+
+        if args.validate_images:
+            store = ImageStore(args.image_cache)
+            images = ImagePipeline(store, transport, workers=args.image_workers,
+                                   per_host=max(args.concurrency, 1), max_age=args.image_max_age_days * 24 * 3600,
+                                   thumbnail_dir=args.thumbnail_dir, thumbnail_url=args.thumbnail_url,
+                                   thumbnail_size=args.thumbnail_size)
+            with REGISTRY.time("images_seconds"):
+                yachts = images.process(yachts)
+            store.close()
+
+    # Export for frontend; when streaming this stage runs the whole pipeline,
+    # so it is not timed as export
+    with nullcontext() if args.stream else REGISTRY.time("export_seconds"):
+        export_for_frontend(counted(yachts, exported_counts, lambda yacht: yacht.source), args.output,
+                            ndjson=args.ndjson, shard_by_source=args.shard_by_source,
+                            delta=args.delta, indexes=args.indexes, related=args.related)
+    if args.stream:
+        close_shared()
+        logger.info(f"Total available yachts: {sum(exported_counts.values())}")
+    if journal:
+        # Exported, so the next run starts over
+        journal.close(completed=True)
+
+    duration = time.monotonic() - run_start
+    REGISTRY.observe("run_duration_seconds", duration)
+    if args.report:
+        write_run_report(args.report, started_at, duration, scraped_counts, exported_counts, rate_limiter, transport)
+    if args.prometheus:
+        REGISTRY.write_prometheus(args.prometheus)
+        logger.info(f"Wrote Prometheus metrics to {args.prometheus}")
 
 
 if __name__ == "__main__":
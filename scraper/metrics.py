@@ -0,0 +1,171 @@
+"""
+Run metrics for the scraper pipeline
+Counters and latency histograms recorded by the fetch, parse, normalize
+and export stages, written at the end of a run as a JSON report and as a
+Prometheus text-format file for the node exporter textfile collector.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from exporter import AtomicFile
+
+PREFIX = "yacht_scraper"
+
+# Latency buckets in seconds
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+METRIC_HELP = {
+    "fetch_seconds": "HTTP request latency",
+    "rate_limit_wait_seconds": "Time spent waiting on the per-host rate limiter",
+    "soup_seconds": "Time spent building parse trees",
+    "parse_seconds": "Time spent in parse_list_page / parse_detail_page",
+    "normalize_seconds": "Time spent normalizing one record",
+    "images_seconds": "Time spent validating images and writing thumbnails",
+    "images_checked_total": "Image URLs checked, by result",
+    "image_probe_bytes_total": "Header bytes read to validate images",
+    "thumbnails_total": "Thumbnails created or reused from the cache",
+    "store_seconds": "Time spent writing and reading the listing store",
+    "dedup_seconds": "Time spent clustering cross-source duplicates",
+    "export_seconds": "Time spent writing the export files",
+    "bytes_downloaded_total": "Response body bytes downloaded",
+    "http_responses_total": "HTTP responses by status code",
+    "cache_hits_total": "Pages served from the HTTP cache",
+    "retries_total": "Fetch retries after transient failures",
+    "fetch_failures_total": "Fetches that failed for good",
+    "items_total": "Records scraped",
+    "filtered_total": "Listings dropped by the filter spec, by stage",
+    "detail_fetches_avoided_total": "Detail pages not fetched because the list card was filtered out",
+    "resumed_total": "Records taken from the checkpoint journal instead of scraped again",
+    "run_duration_seconds": "Wall-clock duration of the run",
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+
+def _labels(labels: dict) -> Labels:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _sample(value: float) -> str:
+    """Counter value without rounding (:g keeps only 6 significant digits)"""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.count += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> list[int]:
+        total, result = 0, []
+        for c in self.counts:
+            total += c
+            result.append(total)
+        return result
+
+
+class Metrics:
+    """Thread-safe registry of counters and histograms keyed by name and labels"""
+
+    def __init__(self):
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._histograms: dict[tuple[str, Labels], Histogram] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1.0, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + amount
+
+    def observe(self, name: str, value: float, **labels):
+        key = (name, _labels(labels))
+        with self._lock:
+            if key not in self._histograms:
+                self._histograms[key] = Histogram()
+            self._histograms[key].observe(value)
+
+    @contextmanager
+    def time(self, name: str, **labels) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter_value(self, name: str, **labels) -> float:
+        """Sum of a counter over all label sets matching the given labels"""
+        wanted = set(_labels(labels))
+        with self._lock:
+            return sum(v for (n, l), v in self._counters.items() if n == name and wanted <= set(l))
+
+    def snapshot(self) -> dict:
+        """Counters and histogram summaries as plain JSON-compatible data"""
+        with self._lock:
+            counters: dict[str, list] = {}
+            for (name, labels), value in sorted(self._counters.items()):
+                counters.setdefault(name, []).append({"labels": dict(labels), "value": value})
+            histograms: dict[str, list] = {}
+            for (name, labels), h in sorted(self._histograms.items(), key=lambda item: item[0]):
+                histograms.setdefault(name, []).append({
+                    "labels": dict(labels),
+                    "count": h.count,
+                    "sum": round(h.sum, 6),
+                    "mean": round(h.sum / h.count, 6) if h.count else 0.0,
+                    "buckets": dict(zip((str(b) for b in h.buckets), h.cumulative())),
+                })
+        return {"counters": counters, "histograms": histograms}
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format"""
+        def fmt(labels: Labels, extra: tuple = ()) -> str:
+            pairs = [*labels, *extra]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+        lines = []
+        with self._lock:
+            for name in sorted({n for n, _ in self._counters}):
+                full = f"{PREFIX}_{name}"
+                lines.append(f"# HELP {full} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full} counter")
+                for (n, labels), value in sorted(self._counters.items()):
+                    if n == name:
+                        lines.append(f"{full}{fmt(labels)} {_sample(value)}")
+
+            for name in sorted({n for n, _ in self._histograms}):
+                full = f"{PREFIX}_{name}"
+                lines.append(f"# HELP {full} {METRIC_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full} histogram")
+                for (n, labels), h in sorted(self._histograms.items(), key=lambda item: item[0]):
+                    if n != name:
+                        continue
+                    for bound, count in zip(h.buckets, h.cumulative()):
+                        lines.append(f"{full}_bucket{fmt(labels, (('le', f'{bound:g}'),))} {count}")
+                    lines.append(f"{full}_bucket{fmt(labels, (('le', '+Inf'),))} {h.count}")
+                    lines.append(f"{full}_sum{fmt(labels)} {h.sum:.6f}")
+                    lines.append(f"{full}_count{fmt(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path):
+        out = AtomicFile(path)
+        out.write(self.to_prometheus().encode("utf-8"))
+        out.commit()
+
+
+# Registry shared by the scrapers and main.py for one run
+REGISTRY = Metrics()
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Any, Callable, Optional
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 
 
 class YachtSource(str, Enum):
@@ -32,10 +33,54 @@ class Currency(str, Enum):
     EUR = "EUR"
 
 
-class Yacht(BaseModel):
+@lru_cache(maxsize=None)
+def _defaults(cls: type[BaseModel]) -> tuple[dict[str, Any], tuple[tuple[str, Callable], ...]]:
+    """Static defaults and default factories of a model, resolved once per class"""
+    enum_values = cls.model_config.get("use_enum_values", False)
+    static, factories = {}, []
+    for name, field in cls.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif not field.is_required():
+            default = field.default
+            static[name] = default.value if enum_values and isinstance(default, Enum) else default
+    return static, tuple(factories)
+
+
+class TrustedModel(BaseModel):
+    """BaseModel with an unvalidated constructor for records built by our own code.
+
+    Subclasses must not use aliases, extra fields, private attributes or
+    model_post_init, which trusted() does not handle.
+    """
+
+    @classmethod
+    def trusted(cls, **data):
+        """Build without validation, the exporter validates once at the boundary.
+
+        Sets up the instance the way model_construct does, but with the
+        defaults looked up once per class instead of walking (and
+        inspecting the factory of) every field on each call.
+        """
+        static, factories = _defaults(cls)
+        values = {**static, **data}
+        for name, factory in factories:
+            if name not in data:
+                values[name] = factory()
+        record = cls.__new__(cls)
+        object.__setattr__(record, "__dict__", values)
+        object.__setattr__(record, "__pydantic_fields_set__", set(data))
+        object.__setattr__(record, "__pydantic_extra__", None)
+        object.__setattr__(record, "__pydantic_private__", None)
+        return record
+
+
+class Yacht(TrustedModel):
     id: str
     source: YachtSource
     source_url: str
+    # Listing URLs of every source carrying this boat (see dedup.py)
+    source_urls: list[str] = Field(default_factory=list)
 
     # Basic info
     name: str
@@ -90,7 +135,7 @@ class Yacht(BaseModel):
 
 
 class ScrapedYachtRaw(BaseModel):
-    """Raw scraped data before normalization"""
+    """Raw scraped data before normalization, validated: it comes from untrusted HTML"""
     source: YachtSource
     source_url: str
     source_id: str
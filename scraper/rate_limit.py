@@ -0,0 +1,128 @@
+"""
+Adaptive per-host rate limiting for the scrapers
+Each host gets its own token bucket whose rate follows AIMD: it grows
+additively while responses are fast and clean, and is cut multiplicatively
+on 429/503, timeouts or slow responses. Retry-After is honoured by pausing
+the host. Other server errors and connection failures say nothing about
+our request rate and are left to the retry policy and circuit breaker
+(see retry.py), so a dead host fails fast instead of being slowed to
+min_rate first.
+"""
+
+import logging
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+# Status codes meaning the host is asking us to slow down
+BACKOFF_STATUSES = {429, 503}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After header as seconds (delta-seconds or HTTP-date)"""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Token bucket for one host (capacity 1, so requests are evenly spaced)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = 1.0
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before sending"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(1.0, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1.0
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            return max(wait, self.paused_until - now)
+
+
+class RateLimiter:
+    """Per-host AIMD rate limiter shared by the fetch paths of a scraper"""
+
+    def __init__(self, initial_rate: float = 0.8, min_rate: float = 0.1, max_rate: float = 4.0,
+                 increase: float = 0.1, decrease: float = 0.5, slow_latency: float = 3.0):
+        """
+        initial_rate: requests/second for a host not seen before (~ the old fixed 1.0-1.5 s sleep)
+        increase:     requests/second added after each fast, successful response
+        decrease:     factor applied on 429/503, timeouts and responses slower than slow_latency
+        """
+        self.initial_rate = initial_rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.slow_latency = slow_latency
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.initial_rate)
+            return self._buckets[host]
+
+    def reserve(self, url: str) -> float:
+        """Seconds to wait before requesting url, with a little jitter"""
+        bucket = self.bucket(url)
+        wait = bucket.reserve()
+        return wait + random.uniform(0, 0.1 / bucket.rate)
+
+    def wait(self, url: str):
+        time.sleep(self.reserve(url))
+
+    def record(self, url: str, latency: Optional[float], status: Optional[int],
+               retry_after: Optional[str] = None, timed_out: bool = False):
+        """Adjust the host rate from a response (status None means the request failed)"""
+        host = urlparse(url).netloc
+        bucket = self.bucket(url)
+        if status is None:
+            if timed_out:
+                with bucket.lock:
+                    bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                logger.warning(f"Rate limit {host}: request timed out, backing off to {bucket.rate:.2f} req/s")
+            return
+        with bucket.lock:
+            old_rate = bucket.rate
+            if status in BACKOFF_STATUSES:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                pause = parse_retry_after(retry_after)
+                if pause:
+                    bucket.paused_until = max(bucket.paused_until, time.monotonic() + pause)
+                logger.warning(f"Rate limit {host}: backing off to {bucket.rate:.2f} req/s "
+                               f"(status {status}{f', retry after {pause:.0f}s' if pause else ''})")
+            elif latency is not None and latency > self.slow_latency:
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                logger.info(f"Rate limit {host}: slow response ({latency:.1f}s), "
+                            f"{old_rate:.2f} -> {bucket.rate:.2f} req/s")
+            elif status < 400:
+                bucket.rate = min(self.max_rate, bucket.rate + self.increase)
+
+    def rates(self) -> dict[str, float]:
+        with self._lock:
+            return {host: bucket.rate for host, bucket in self._buckets.items()}
+
+    def log_rates(self):
+        for host, rate in self.rates().items():
+            logger.info(f"Rate limit {host}: {rate:.2f} req/s")
@@ -0,0 +1,208 @@
+"""
+Related-yacht recommendations, precomputed at export
+Scores every exported yacht against every available one the way
+getRelatedYachts in src/lib/yachts.ts does, and keeps the top k ids per
+yacht, so a detail page is a lookup instead of an O(n) scan (O(n^2) for a
+static build):
+
+    same yacht_type                  +10
+    price within 50% of this one     +5 * (1 - diff)
+    length within 20% of this one    +3 * (1 - diff)
+    year built within 5 years        +2 * (1 - years / 5)
+
+Ties keep export order, like the stable sort on the frontend. Uses NumPy
+when it is installed: yachts are scored in blocks against the candidates of
+their own type, and only those whose top k could still be beaten by another
+type are scored against every candidate. NumPy is in requirements.txt; the
+pure-Python fallback is quadratic and meant for small inventories, and
+warns above PYTHON_WARN_SIZE yachts.
+"""
+
+import heapq
+import logging
+import time
+from typing import Optional
+
+try:
+    import numpy as np
+except ImportError:  # optional speedup
+    np = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 3
+# Score matrix cells per NumPy block (rows x candidates)
+BLOCK_CELLS = 1 << 19
+
+CANDIDATE_STATUS = "available"
+
+# The pure-Python pass takes about 0.5s per 1k yachts and grows quadratically
+PYTHON_WARN_SIZE = 2000
+
+
+class RelatedIndex:
+    """Collects the scored fields of exported records, in export order"""
+
+    def __init__(self, limit: int = DEFAULT_LIMIT):
+        self.limit = limit
+        self.ids: list[str] = []
+        self.types: list[str] = []
+        self.available: list[bool] = []
+        self.prices: list[Optional[float]] = []
+        self.lengths: list[Optional[float]] = []
+        self.years: list[Optional[int]] = []
+
+    def add(self, record: dict):
+        self.ids.append(record["id"])
+        self.types.append(record.get("yacht_type"))
+        self.available.append(record.get("status") == CANDIDATE_STATUS)
+        # Zero counts as missing, like the truthiness checks on the frontend
+        self.prices.append(record.get("price") or None)
+        self.lengths.append(record.get("length_m") or None)
+        self.years.append(record.get("year_built") or None)
+
+    def build(self) -> dict[str, list[str]]:
+        if np is None and len(self.ids) > PYTHON_WARN_SIZE:
+            logger.warning(f"NumPy is not installed: scoring related yachts for {len(self.ids)} yachts "
+                           f"in pure Python is quadratic and may take minutes (pip install numpy)")
+        start = time.perf_counter()
+        top = self._top_numpy() if np is not None else self._top_python()
+        logger.info(f"Related yachts: top {self.limit} for {len(self.ids)} yachts in "
+                    f"{time.perf_counter() - start:.2f}s ({'numpy' if np is not None else 'python'})")
+        return {self.ids[i]: [self.ids[j] for j in row] for i, row in enumerate(top)}
+
+    def _top_python(self) -> list[list[int]]:
+        candidates = [j for j, ok in enumerate(self.available) if ok]
+        top = []
+        for i in range(len(self.ids)):
+            scored = ((-self._score(i, j), j) for j in candidates if j != i)
+            top.append([j for _, j in heapq.nsmallest(self.limit, scored)])
+        return top
+
+    def _score(self, i: int, j: int) -> float:
+        score = 0.0
+        if self.types[j] == self.types[i]:
+            score += 10
+        price, other = self.prices[i], self.prices[j]
+        if price and other:
+            diff = abs(other - price) / price
+            if diff < 0.5:
+                score += 5 * (1 - diff)
+        length, other = self.lengths[i], self.lengths[j]
+        if length and other:
+            diff = abs(other - length) / length
+            if diff < 0.2:
+                score += 3 * (1 - diff)
+        year, other = self.years[i], self.years[j]
+        if year and other:
+            diff = abs(other - year)
+            if diff <= 5:
+                score += 2 * (1 - diff / 5)
+        return score
+
+    def _top_numpy(self) -> list[list[int]]:
+        def column(values):
+            return np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+
+        type_codes = {t: n for n, t in enumerate(dict.fromkeys(self.types))}
+        types = np.array([type_codes[t] for t in self.types], dtype=np.int64)
+        fields = (types, column(self.prices), column(self.lengths), column(self.years))
+        candidates = np.flatnonzero(np.array(self.available, dtype=bool))
+        k = min(self.limit, len(candidates))
+        if k == 0:
+            return [[] for _ in self.ids]
+
+        # Same type scores at least 10, any other type at most the weights of the
+        # fields this yacht has (5 + 3 + 2 with all three). Once the kth best of
+        # the same type scores above that, nothing else can make the top k; only
+        # the remaining rows are scored against every candidate.
+        bound = sum(np.where(np.isnan(values), 0.0, weight) for values, weight in zip(fields[1:], (5, 3, 2)))
+        top: list[Optional[list[int]]] = [None] * len(self.ids)
+        rest = []
+        for code in range(len(type_codes)):
+            rows = np.flatnonzero(types == code)
+            same = candidates[types[candidates] == code]
+            for block, picks, kth in _top_blocks(fields, rows, same, k):
+                for row, pick, score, limit in zip(block.tolist(), picks, kth.tolist(), bound[block].tolist()):
+                    if len(pick) == k and score > limit:
+                        top[row] = pick
+                    else:
+                        rest.append(row)
+        for block, picks, _ in _top_blocks(fields, np.array(rest, dtype=np.int64), candidates, k):
+            for row, pick in zip(block.tolist(), picks):
+                top[row] = pick
+        return top
+
+
+def _top_blocks(fields, rows, columns, k: int):
+    """(rows, top k of each, kth best score) per block of rows scored against columns"""
+    k = min(k, len(columns))
+    if k == 0:
+        yield rows, [[] for _ in rows], np.full(len(rows), -np.inf)
+        return
+    # Gathered once instead of once per block
+    column_fields = [values[columns] for values in fields]
+    step = max(BLOCK_CELLS // max(len(columns), 1), 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for start in range(0, len(rows), step):
+            block = rows[start:start + step]
+            scores = _scores([values[block, None] for values in fields], column_fields)
+            # A yacht is never related to itself
+            own = np.minimum(np.searchsorted(columns, block), len(columns) - 1)
+            hit = columns[own] == block
+            scores[np.flatnonzero(hit), own[hit]] = -np.inf
+            picks, values = _top_rows(scores, k)
+            kth = values[:, -1]
+            picks = columns[picks].tolist()
+            # Fewer than k other candidates: drop the yacht itself
+            for i in np.flatnonzero(kth == -np.inf).tolist():
+                picks[i] = [c for c, v in zip(picks[i], values[i].tolist()) if v > -np.inf]
+            yield block, picks, kth
+
+
+def _scores(rows, columns):
+    """Score matrix of rows x columns.
+
+    Same operations in the same order as the frontend, so scores (and ties)
+    match it exactly. Terms outside their range are multiplied by zero and
+    clamped with fmax, which also turns the NaN of a missing value into 0;
+    both are much faster than np.where or a masked add, and every step
+    writes into the same two buffers.
+    """
+    (types, prices, lengths, years), (c_types, c_prices, c_lengths, c_years) = rows, columns
+    scores = np.multiply(c_types == types, 10.0)
+    diff, within = np.empty_like(scores), np.empty(scores.shape, dtype=bool)
+    for base, values, limit, weight, relative in ((prices, c_prices, 0.5, 5, True),
+                                                  (lengths, c_lengths, 0.2, 3, True),
+                                                  (years, c_years, 5, 2, False)):
+        np.subtract(values, base, out=diff)
+        np.abs(diff, out=diff)
+        if relative:
+            diff /= base
+            np.less(diff, limit, out=within)
+        else:
+            # Years: absolute difference, inclusive limit, scaled after the check
+            np.less_equal(diff, limit, out=within)
+            diff /= limit
+        np.subtract(1, diff, out=diff)
+        diff *= weight
+        diff *= within
+        scores += np.fmax(diff, 0, out=diff)
+    return scores
+
+
+def _top_rows(scores, k: int):
+    """Column positions and scores of the k best per row, in the frontend's order.
+
+    Takes the best column k times: argmax returns the first of equal scores,
+    which is the stable sort's export order. Overwrites scores.
+    """
+    rows = np.arange(len(scores))
+    picks = np.empty((len(scores), k), dtype=np.int64)
+    values = np.empty((len(scores), k))
+    for n in range(k):
+        best = scores.argmax(axis=1)
+        picks[:, n] = best
+        values[:, n] = scores[rows, best]
+        scores[rows, best] = -np.inf
+    return picks, values
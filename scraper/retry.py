@@ -0,0 +1,98 @@
+"""
+Retry policy and per-host circuit breaker for the fetch layer
+Transient failures (timeouts, connection errors, 429/5xx) of idempotent
+GETs are retried with jittered exponential backoff. After repeated
+failures a host's breaker opens and its remaining URLs fail fast until a
+probe request is allowed through again.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """Jittered exponential backoff ("full jitter") for transient request failures"""
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0, max_delay: float = 30.0,
+                 retry_statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504})):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_statuses = retry_statuses
+
+    def is_transient(self, error: requests.RequestException) -> bool:
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        response: Optional[requests.Response] = getattr(error, "response", None)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def should_retry(self, error: requests.RequestException, attempt: int) -> bool:
+        """attempt is 0-based: the number of the attempt that just failed"""
+        return attempt + 1 < self.max_attempts and self.is_transient(error)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+class _HostCircuit:
+    def __init__(self):
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+
+
+class CircuitBreaker:
+    """Per-host circuit breaker: closed -> open after N failures -> half-open probe"""
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.fast_failed = 0
+        self._circuits: dict[str, _HostCircuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit(self, url: str) -> tuple[str, _HostCircuit]:
+        host = urlparse(url).netloc
+        if host not in self._circuits:
+            self._circuits[host] = _HostCircuit()
+        return host, self._circuits[host]
+
+    def allow(self, url: str) -> bool:
+        """False while the host's breaker is open; lets one probe through after reset_timeout"""
+        with self._lock:
+            host, circuit = self._circuit(url)
+            if circuit.opened_at is None:
+                return True
+            if not circuit.probing and time.monotonic() - circuit.opened_at >= self.reset_timeout:
+                circuit.probing = True
+                logger.info(f"Circuit {host}: half-open, probing with {url}")
+                return True
+            self.fast_failed += 1
+            return False
+
+    def record_success(self, url: str):
+        with self._lock:
+            host, circuit = self._circuit(url)
+            if circuit.opened_at is not None:
+                logger.info(f"Circuit {host}: closed again")
+            circuit.failures = 0
+            circuit.opened_at = None
+            circuit.probing = False
+
+    def record_failure(self, url: str):
+        with self._lock:
+            host, circuit = self._circuit(url)
+            circuit.failures += 1
+            if circuit.probing or (circuit.opened_at is None and circuit.failures >= self.failure_threshold):
+                circuit.opened_at = time.monotonic()
+                circuit.probing = False
+                logger.error(f"Circuit {host}: open after {circuit.failures} consecutive failures, "
+                             f"failing fast for {self.reset_timeout:.0f}s")
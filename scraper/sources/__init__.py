@@ -1,5 +1,6 @@
+from .base import BaseYachtScraper, ItemBudget
 from .aokiyacht import AokiYachtScraper
 from .boatworld import BoatWorldScraper
 from .chukotei import ChukoteiScraper
 
-__all__ = ["AokiYachtScraper", "BoatWorldScraper", "ChukoteiScraper"]
+__all__ = ["BaseYachtScraper", "ItemBudget", "AokiYachtScraper", "BoatWorldScraper", "ChukoteiScraper"]
@@ -4,7 +4,7 @@ https://www.aokiyacht.com/usedboat/
 Specializes in refurbished sailboats
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Optional
 import re
 import logging
@@ -34,6 +34,10 @@ class AokiYachtScraper(BaseYachtScraper):
     source = YachtSource.AOKIYACHT
     base_url = "https://www.aokiyacht.com"
 
+    # List pages only need the detail links and pagination
+    list_parser_backend = "strained"
+    list_strainer = SoupStrainer(["a", "link"])
+
     def get_list_urls(self) -> list[str]:
         return [f"{self.base_url}/usedboat/"]
 
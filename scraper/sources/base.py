@@ -1,19 +1,80 @@
 import requests
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
-from typing import Optional
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import Callable, Iterator, Optional
+from urllib.parse import parse_qs, urlencode, urljoin, urlparse
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+import asyncio
+import os
+import queue
+import threading
 import time
-import random
 import logging
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from models import ScrapedYachtRaw, YachtSource
+from http_cache import HttpCache
+from fingerprints import card_fingerprint
+from listing_store import ListingStore
+from rate_limit import RateLimiter
+from retry import CircuitBreaker, RetryPolicy
+from transport import HttpTransport
+from archive import PageArchive
+from metrics import REGISTRY
+from filters import FilterSpec
+from checkpoint import CheckpointJournal, JournalPage
+from .parsers import make_soup
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Scraper instance used by parse worker processes (see scrape_all_pipelined)
+_worker_scraper: Optional["BaseYachtScraper"] = None
+
+
+def _init_parse_worker(scraper_cls: type["BaseYachtScraper"], parser_backend: str, list_parser_backend: str):
+    global _worker_scraper
+    _worker_scraper = scraper_cls()
+    # Backends chosen on the command line live on the parent's instance
+    _worker_scraper.parser_backend = parser_backend
+    _worker_scraper.list_parser_backend = list_parser_backend
+
+
+def _worker_backends() -> tuple[str, str]:
+    return _worker_scraper.parser_backend, _worker_scraper.list_parser_backend
+
+
+def _parse_detail_html(html: str, url: str) -> tuple[Optional[ScrapedYachtRaw], float]:
+    """Build the soup and run parse_detail_page inside a worker process.
+
+    Returns the record and the seconds spent, metrics live in the parent.
+    """
+    start = time.perf_counter()
+    yacht = _worker_scraper.parse_detail_page(_worker_scraper._make_soup(html), url)
+    return yacht, time.perf_counter() - start
+
+
+class ItemBudget:
+    """Thread-safe item budget shared by scrapers running in parallel"""
+
+    def __init__(self, total: int):
+        self.remaining = total
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        """Claim one item from the budget, returns False once it is exhausted"""
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+    @property
+    def exhausted(self) -> bool:
+        return self.remaining <= 0
+
 
 class BaseYachtScraper(ABC):
     """Base class for yacht scrapers"""
@@ -21,32 +82,294 @@ class BaseYachtScraper(ABC):
     source: YachtSource
     base_url: str
 
+    # Max in-flight requests per host for the async engine
+    max_concurrency: int = 4
+
+    # Crawl strategy: "full" fetches every detail page, "list-only" emits
+    # list-card records, "hybrid" fetches details only to fill missing fields
+    CRAWL_MODES = ("full", "list-only", "hybrid")
+    # Card fields that trigger a detail fetch in hybrid mode when missing
+    hybrid_required_fields: tuple[str, ...] = ("raw_price", "raw_length", "raw_year")
+
+    # Parser backends (see parsers.py): "bs4", "lxml" or "strained" (list pages only)
+    parser_backend: str = "bs4"
+    list_parser_backend: str = "bs4"
+    # Elements kept by the "strained" backend, enough for parse_list_page
+    # and next_page_url
+    list_strainer: Optional[SoupStrainer] = None
+
+    # Pagination: "next" links are followed from each seed in get_list_urls;
+    # sources whose pages have no such link can name a page-number query param
+    next_page_selector: str = "a[rel='next'], link[rel='next']"
+    next_page_texts: tuple[str, ...] = ("次へ", "次のページ", "次ページ", "Next", "»", "›")
+    page_param: Optional[str] = None
+    max_list_pages: int = 50
+
+    # Status badges looked for in list-card text (see card_status)
+    card_status_markers: tuple[str, ...] = ("売約済", "売約", "SOLD", "Sold", "商談中", "入荷予定")
+
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
-            "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
-        })
-
-    def fetch_page(self, url: str, delay: float = 1.0) -> Optional[BeautifulSoup]:
-        """Fetch a page and return BeautifulSoup object"""
-        try:
-            # Random delay to be polite
-            time.sleep(delay + random.uniform(0, 0.5))
+        # HTTP transport, main.py shares one (pools, keep-alive, compression) between scrapers
+        self.transport = HttpTransport(pool_maxsize=self.max_concurrency)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        # Per-host adaptive rate limiter, main.py may share one between scrapers
+        self.rate_limiter = RateLimiter()
+        # Retries for transient failures and per-host fast-fail when a host is down
+        self.retry_policy = RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+        # Optional stop conditions set by main.py for parallel runs
+        self.deadline: Optional[float] = None  # time.monotonic() timestamp
+        self.budget: Optional[ItemBudget] = None
+        # Optional persistent response cache shared between scrapers
+        self.cache: Optional[HttpCache] = None
+        # Optional listing store holding the list-card fingerprints for incremental crawls
+        self.fingerprints: Optional[ListingStore] = None
+        # Optional record/replay archive of fetched pages
+        self.archive: Optional[PageArchive] = None
+        self.skipped_unchanged = 0
+        # Optional filter spec set by main.py: pushed into list URLs by
+        # apply_list_filters and checked on list cards by card_filter
+        self.filters: Optional[FilterSpec] = None
+        self.card_filter: Optional[Callable[[ScrapedYachtRaw], bool]] = None
+        self.skipped_filtered = 0
+        # Optional checkpoint journal for resumable runs
+        self.checkpoint: Optional[CheckpointJournal] = None
+        self.mode = "full"
+        # Per-stage counters and latency histograms (see metrics.py)
+        self.metrics = REGISTRY
+
+    @property
+    def session(self) -> requests.Session:
+        return self.transport.session
 
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
+    def _should_stop(self) -> bool:
+        """Check the global deadline and shared item budget"""
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            logger.warning(f"[{self.source}] Global deadline reached, stopping")
+            return True
+        if self.budget is not None and self.budget.exhausted:
+            logger.info(f"[{self.source}] Shared item budget exhausted, stopping")
+            return True
+        return False
 
-            # Auto-detect encoding
-            if response.encoding is None or response.encoding == "ISO-8859-1":
-                response.encoding = response.apparent_encoding
+    def _claim(self, yacht: ScrapedYachtRaw) -> bool:
+        """Count a scraped yacht if the shared budget allows it"""
+        if self.budget is not None and not self.budget.take():
+            return False
+        self.metrics.inc("items_total", source=self.source.value)
+        logger.info(f"[{self.source}] Scraped: {yacht.raw_name}")
+        return True
 
-            return BeautifulSoup(response.text, "lxml")
+    def _accept(self, yachts: list[ScrapedYachtRaw], yacht: ScrapedYachtRaw) -> bool:
+        """Append a scraped yacht if the shared budget allows it"""
+        if not self._claim(yacht):
+            return False
+        yachts.append(yacht)
+        return True
 
+    def _resumed(self) -> list[ScrapedYachtRaw]:
+        """Records the checkpoint journal already holds for this source"""
+        if not self.checkpoint:
+            return []
+        records = self.checkpoint.records(self.source.value)
+        if records:
+            logger.info(f"[{self.source}] Resuming with {len(records)} records from the checkpoint")
+        return records
+
+    def _claim_resumed(self, yacht: ScrapedYachtRaw) -> bool:
+        if not self._claim(yacht):
+            return False
+        self.metrics.inc("resumed_total", source=self.source.value)
+        return True
+
+    def _checkpointed(self, detail_url: str) -> bool:
+        return bool(self.checkpoint) and self.checkpoint.has_record(self.source.value, detail_url)
+
+    def _journal(self, detail_url: str, yacht: ScrapedYachtRaw):
+        if self.checkpoint:
+            self.checkpoint.add_record(self.source.value, detail_url, yacht)
+
+    def _download(self, url: str) -> str:
+        """Download a page and return its decoded text (raises on HTTP errors)"""
+        entry = self.cache.lookup(url) if self.cache else None
+        headers = HttpCache.conditional_headers(entry)
+
+        start = time.monotonic()
+        try:
+            response = self.transport.get(url, source=self.source.value, timeout=30, headers=headers)
         except requests.RequestException as e:
-            logger.error(f"Error fetching {url}: {e}")
+            self.rate_limiter.record(url, None, None, timed_out=isinstance(e, requests.Timeout))
+            raise
+        latency = time.monotonic() - start
+        self.rate_limiter.record(url, latency, response.status_code, response.headers.get("Retry-After"))
+        self.metrics.observe("fetch_seconds", latency, source=self.source.value)
+        self.metrics.inc("http_responses_total", source=self.source.value, status=response.status_code)
+        self.metrics.inc("bytes_downloaded_total", len(response.content), source=self.source.value)
+
+        # Not modified: serve the cached body
+        if entry and response.status_code == 304:
+            self.cache.touch(url, revalidated=True)
+            self.metrics.inc("cache_hits_total", source=self.source.value, kind="revalidated")
+            if self.archive:
+                self.archive.record(url, entry.body)
+            return entry.body
+
+        response.raise_for_status()
+
+        # Auto-detect encoding
+        if response.encoding is None or response.encoding == "ISO-8859-1":
+            response.encoding = response.apparent_encoding
+
+        if self.cache:
+            self.cache.store(url, response.text, response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        if self.archive:
+            self.archive.record(url, response.text)
+
+        return response.text
+
+    def _fresh_html(self, url: str) -> Optional[str]:
+        """Page body from the cache while it is fresh, served without a request (or polite delay)"""
+        if not self.cache:
             return None
+        html = self.cache.get_fresh(url)
+        if html is not None:
+            self.metrics.inc("cache_hits_total", source=self.source.value, kind="fresh")
+            # A recording must hold every page the run used, cached or not
+            if self.archive and not self.archive.replaying:
+                self.archive.record(url, html)
+        return html
+
+    def _cached_soup(self, url: str, list_page: bool = False) -> Optional[BeautifulSoup]:
+        html = self._fresh_html(url)
+        return self._make_soup(html, list_page) if html is not None else None
+
+    @property
+    def parses_cards(self) -> bool:
+        """Whether this source overrides parse_list_page_with_data"""
+        return type(self).parse_list_page_with_data is not BaseYachtScraper.parse_list_page_with_data
+
+    @property
+    def _needs_cards(self) -> bool:
+        """List cards are parsed for incremental, list-based and filtered crawls of sources that have them"""
+        return self.parses_cards and bool(self.fingerprints or self.mode != "full" or self.card_filter)
+
+    def _make_soup(self, html: str, list_page: bool = False) -> BeautifulSoup:
+        """Build the parse tree for a downloaded page with the configured backend"""
+        if not list_page:
+            with self.metrics.time("soup_seconds", source=self.source.value, page="detail"):
+                return make_soup(html, self.parser_backend)
+
+        backend = self.list_parser_backend
+        # List-card parsing needs the full tree around each listing
+        if backend == "strained" and self._needs_cards:
+            backend = self.parser_backend
+        with self.metrics.time("soup_seconds", source=self.source.value, page="list"):
+            return make_soup(html, backend, self.list_strainer)
+
+    def _parse_list(self, soup: BeautifulSoup) -> list[str]:
+        with self.metrics.time("parse_seconds", source=self.source.value, page="list"):
+            return self.parse_list_page(soup)
+
+    def _parse_detail(self, soup: BeautifulSoup, url: str) -> Optional[ScrapedYachtRaw]:
+        with self.metrics.time("parse_seconds", source=self.source.value, page="detail"):
+            return self.parse_detail_page(soup, url)
+
+    def _fetch_failed(self, url: str, error: requests.RequestException, attempt: int) -> Optional[float]:
+        """Return the backoff before retrying url, or None once the fetch has failed for good"""
+        if self.retry_policy.should_retry(error, attempt):
+            backoff = self.retry_policy.backoff(attempt)
+            self.metrics.inc("retries_total", source=self.source.value)
+            logger.warning(f"Retrying {url} in {backoff:.1f}s "
+                           f"(attempt {attempt + 2}/{self.retry_policy.max_attempts}): {error}")
+            return backoff
+
+        logger.error(f"Error fetching {url}: {error}")
+        self.metrics.inc("fetch_failures_total", source=self.source.value)
+        # Only failures that say the host is struggling count towards its breaker
+        if self.retry_policy.is_transient(error):
+            self.circuit_breaker.record_failure(url)
+        else:
+            self.circuit_breaker.record_success(url)
+        return None
+
+    def fetch_html(self, url: str) -> Optional[str]:
+        """Fetch a page and return its raw HTML"""
+        if self.archive and self.archive.replaying:
+            return self.archive.replay(url)
+
+        html = self._fresh_html(url)
+        if html is not None:
+            return html
+
+        if not self.circuit_breaker.allow(url):
+            return None
+
+        attempt = 0
+        while True:
+            try:
+                # Wait for the host's rate limiter to be polite
+                with self.metrics.time("rate_limit_wait_seconds", source=self.source.value):
+                    self.rate_limiter.wait(url)
+                html = self._download(url)
+            except requests.RequestException as e:
+                backoff = self._fetch_failed(url, e, attempt)
+                if backoff is None:
+                    return None
+                time.sleep(backoff)
+                attempt += 1
+                continue
+
+            self.circuit_breaker.record_success(url)
+            return html
+
+    def fetch_page(self, url: str, list_page: bool = False) -> Optional[BeautifulSoup]:
+        """Fetch a page and return BeautifulSoup object"""
+        html = self.fetch_html(url)
+        return self._make_soup(html, list_page) if html is not None else None
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Per-host semaphore limiting in-flight requests for the async engine"""
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_concurrency)
+        return self._host_semaphores[host]
+
+    async def fetch_page_async(self, url: str, list_page: bool = False) -> Optional[BeautifulSoup]:
+        """Async variant of fetch_page.
+
+        The rate limiter wait is taken while holding a per-host slot, so up
+        to max_concurrency waits and requests overlap instead of adding up
+        serially.
+        """
+        if self.archive and self.archive.replaying:
+            html = self.archive.replay(url)
+            return self._make_soup(html, list_page) if html is not None else None
+
+        cached = self._cached_soup(url, list_page)
+        if cached:
+            return cached
+
+        if not self.circuit_breaker.allow(url):
+            return None
+
+        attempt = 0
+        while True:
+            try:
+                async with self._host_semaphore(url):
+                    with self.metrics.time("rate_limit_wait_seconds", source=self.source.value):
+                        await asyncio.sleep(self.rate_limiter.reserve(url))
+                    html = await asyncio.to_thread(self._download, url)
+            except requests.RequestException as e:
+                # Back off without holding the host slot
+                backoff = self._fetch_failed(url, e, attempt)
+                if backoff is None:
+                    return None
+                await asyncio.sleep(backoff)
+                attempt += 1
+                continue
+
+            self.circuit_breaker.record_success(url)
+            return await asyncio.to_thread(self._make_soup, html, list_page)
 
     @abstractmethod
     def get_list_urls(self) -> list[str]:
@@ -63,38 +386,384 @@ class BaseYachtScraper(ABC):
         """Parse a yacht detail page and return raw yacht data"""
         pass
 
-    def scrape_all(self, max_items: int = 50) -> list[ScrapedYachtRaw]:
-        """Scrape all yachts from this source"""
-        yachts = []
+    def apply_list_filters(self, url: str) -> str:
+        """List URL with the server-side equivalent of self.filters (override per source)"""
+        return url
 
-        list_urls = self.get_list_urls()
-        logger.info(f"[{self.source}] Found {len(list_urls)} list pages to scrape")
+    def card_status(self, item) -> Optional[str]:
+        """Status badge of a list card, None when it shows none"""
+        text = item.get_text(" ", strip=True)
+        for marker in self.card_status_markers:
+            if marker in text:
+                return marker
+        return None
 
-        for list_url in list_urls:
-            soup = self.fetch_page(list_url)
-            if not soup:
-                continue
+    def _list_cards(self, soup: BeautifulSoup, url: str) -> dict[str, ScrapedYachtRaw]:
+        """Listing cards by detail URL, only needed for incremental, list-based and filtered crawls"""
+        if not self._needs_cards:
+            return {}
+        cards = {card.source_url: card for card in self.parse_list_page_with_data(soup, url)}
+        if not cards and self.mode != "full":
+            logger.warning(f"[{self.source}] No list-card data on {url}, falling back to detail pages")
+        return cards
+
+    def _missing_fields(self, card: ScrapedYachtRaw) -> list[str]:
+        missing = [f for f in self.hybrid_required_fields if not getattr(card, f)]
+        if card.raw_name == "Unknown":
+            missing.append("raw_name")
+        return missing
+
+    def _card_record(self, card: Optional[ScrapedYachtRaw]) -> Optional[ScrapedYachtRaw]:
+        """Card record usable without a detail fetch in list-only/hybrid mode"""
+        if not card or self.mode == "full":
+            return None
+        if self.mode == "list-only" or not self._missing_fields(card):
+            return card
+        return None
+
+    @staticmethod
+    def _merge_detail(card: ScrapedYachtRaw, detail: ScrapedYachtRaw) -> ScrapedYachtRaw:
+        """Fill fields missing from a list card with values from its detail page"""
+        update = {}
+        for field, value in detail:
+            current = getattr(card, field)
+            if value and (not current or (field == "raw_name" and current == "Unknown")):
+                update[field] = value
+        return card.model_copy(update=update)
+
+    def _finish_detail(self, url: str, cards: dict[str, ScrapedYachtRaw],
+                       yacht: Optional[ScrapedYachtRaw]) -> Optional[ScrapedYachtRaw]:
+        """Record a parsed detail page, merging it into its card in hybrid mode"""
+        if not yacht:
+            return None
+        self._remember(url, cards, yacht)
+        card = cards.get(url)
+        if self.mode == "hybrid" and card:
+            return self._merge_detail(card, yacht)
+        return yacht
+
+    def _unchanged_record(self, detail_url: str, cards: dict[str, ScrapedYachtRaw]) -> Optional[ScrapedYachtRaw]:
+        """Stored record for a listing whose card did not change since the last run"""
+        card = cards.get(detail_url)
+        if not self.fingerprints or not card:
+            return None
+        record = self.fingerprints.get_unchanged(self.source.value, detail_url, card_fingerprint(card))
+        if record:
+            self.skipped_unchanged += 1
+        return record
+
+    def _remember(self, detail_url: str, cards: dict[str, ScrapedYachtRaw], yacht: ScrapedYachtRaw):
+        card = cards.get(detail_url)
+        if self.fingerprints and card:
+            self.fingerprints.save(self.source.value, detail_url, card_fingerprint(card), yacht)
+
+    def _filtered_out(self, detail_url: str, cards: dict[str, ScrapedYachtRaw]) -> bool:
+        """Whether the listing's card is outside the filter spec, counting the detail fetch saved"""
+        card = cards.get(detail_url)
+        if not self.card_filter or not card or self.card_filter(card):
+            return False
+        self.skipped_filtered += 1
+        self.metrics.inc("filtered_total", source=self.source.value, stage="card")
+        if self._card_record(card) is None:
+            self.metrics.inc("detail_fetches_avoided_total", source=self.source.value)
+        return True
+
+    def _scrape_detail(self, url: str, cards: dict[str, ScrapedYachtRaw]) -> Optional[ScrapedYachtRaw]:
+        """Produce the record for one listing, fetching its detail page only when needed"""
+        record = self._card_record(cards.get(url)) or self._unchanged_record(url, cards)
+        if record:
+            return record
+        soup = self.fetch_page(url)
+        if not soup:
+            return None
+        return self._finish_detail(url, cards, self._parse_detail(soup, url))
+
+    def next_page_url(self, soup: BeautifulSoup, url: str) -> Optional[str]:
+        """Find the next list page from a "next" link or the page-number param"""
+        link = soup.select_one(self.next_page_selector)
+        if not link:
+            for a in soup.select("a[href]"):
+                if a.get_text(strip=True) in self.next_page_texts:
+                    link = a
+                    break
+        if link and link.get("href"):
+            return urljoin(url, link.get("href"))
+
+        if self.page_param:
+            parsed = urlparse(url)
+            query = parse_qs(parsed.query)
+            page = int(query.get(self.page_param, ["1"])[0])
+            query[self.page_param] = [str(page + 1)]
+            return parsed._replace(query=urlencode(query, doseq=True)).geturl()
+        return None
+
+    def _submit_list_page(self, prefetcher: ThreadPoolExecutor, url: str) -> Future:
+        """Prefetch a list page, or resolve at once to its journal entry if the checkpoint finished it"""
+        page = self.checkpoint.finished_page(self.source.value, url) if self.checkpoint else None
+        if page is None:
+            return prefetcher.submit(self.fetch_page, url, list_page=True)
+        future: Future = Future()
+        future.set_result(page)
+        return future
+
+    def iter_list_pages(self) -> Iterator[tuple[str, BeautifulSoup, list[str]]]:
+        """Lazily walk the list pages, yielding (url, soup, new detail URLs).
+
+        Each seed from get_list_urls is followed page by page until a page
+        has no new detail URLs. The next page is prefetched in the background
+        while the caller works through the current one; closing the generator
+        (e.g. once max_items is reached) stops pagination. Pages the checkpoint
+        journal finished are followed from the journal, neither fetched nor
+        yielded.
+        """
+        seen: set[str] = set()
+        visited: set[str] = set()
+        prefetcher = ThreadPoolExecutor(max_workers=1)
+        try:
+            seeds = [self.apply_list_filters(url) for url in self.get_list_urls()]
+            logger.info(f"[{self.source}] Found {len(seeds)} list page seeds to scrape")
+
+            for seed in seeds:
+                url: Optional[str] = seed
+                pending = self._submit_list_page(prefetcher, seed)
+                pages = 0
+                while url and pending and pages < self.max_list_pages:
+                    if self._should_stop():
+                        return
+                    soup = pending.result()
+                    visited.add(url)
+                    pages += 1
+                    if not soup:
+                        break
 
-            detail_urls = self.parse_list_page(soup)
-            logger.info(f"[{self.source}] Found {len(detail_urls)} yachts on {list_url}")
+                    journaled = isinstance(soup, JournalPage)
+                    found = soup.detail_urls if journaled else self._parse_list(soup)
+                    detail_urls = [u for u in dict.fromkeys(found) if u not in seen]
+                    logger.info(f"[{self.source}] Found {len(detail_urls)} new yachts on {url}"
+                                + (" (from the checkpoint)" if journaled else ""))
+                    if not detail_urls:
+                        break
+                    seen.update(detail_urls)
 
-            for detail_url in detail_urls:
-                if len(yachts) >= max_items:
-                    logger.info(f"[{self.source}] Reached max items limit ({max_items})")
-                    return yachts
+                    next_url = soup.next_url if journaled else self.next_page_url(soup, url)
+                    if next_url in visited:
+                        next_url = None
+                    pending = self._submit_list_page(prefetcher, next_url) if next_url else None
 
-                detail_soup = self.fetch_page(detail_url)
-                if not detail_soup:
-                    continue
+                    if not journaled:
+                        if self.checkpoint:
+                            self.checkpoint.add_page(self.source.value, url, detail_urls, next_url)
+                        yield url, soup, detail_urls
+                    url = next_url
+        finally:
+            prefetcher.shutdown(wait=False, cancel_futures=True)
 
-                yacht = self.parse_detail_page(detail_soup, detail_url)
-                if yacht:
-                    yachts.append(yacht)
-                    logger.info(f"[{self.source}] Scraped: {yacht.raw_name}")
+    def iter_yachts(self, max_items: int = 50) -> Iterator[ScrapedYachtRaw]:
+        """Scrape yachts from this source, yielding each one as soon as it is parsed.
 
+        Only the current list page is held in memory; closing the generator
+        stops the crawl.
+        """
+        count = 0
+        for yacht in self._resumed():
+            if count >= max_items:
+                logger.info(f"[{self.source}] Reached max items limit ({max_items})")
+                return
+            if self._claim_resumed(yacht):
+                count += 1
+                yield yacht
+
+        pages = self.iter_list_pages()
+        try:
+            for list_url, soup, detail_urls in pages:
+                cards = self._list_cards(soup, list_url)
+
+                for detail_url in detail_urls:
+                    if count >= max_items:
+                        logger.info(f"[{self.source}] Reached max items limit ({max_items})")
+                        return
+                    if self._should_stop():
+                        return
+                    if self._checkpointed(detail_url) or self._filtered_out(detail_url, cards):
+                        continue
+
+                    yacht = self._scrape_detail(detail_url, cards)
+                    if yacht and self._claim(yacht):
+                        count += 1
+                        self._journal(detail_url, yacht)
+                        yield yacht
+        finally:
+            pages.close()
+
+        logger.info(f"[{self.source}] Total yachts scraped: {count}")
+
+    def scrape_all(self, max_items: int = 50) -> list[ScrapedYachtRaw]:
+        """Scrape all yachts from this source"""
+        return list(self.iter_yachts(max_items))
+
+    async def _scrape_detail_async(self, url: str, cards: dict[str, ScrapedYachtRaw]) -> Optional[ScrapedYachtRaw]:
+        if self._should_stop():
+            return None
+        record = self._card_record(cards.get(url)) or self._unchanged_record(url, cards)
+        if record:
+            return record
+        soup = await self.fetch_page_async(url)
+        if not soup:
+            return None
+        return self._finish_detail(url, cards, self._parse_detail(soup, url))
+
+    async def scrape_all_async(self, max_items: int = 50) -> list[ScrapedYachtRaw]:
+        """Async variant of scrape_all fetching up to max_concurrency pages per host at once"""
+        # Semaphores are bound to the running event loop
+        self._host_semaphores = {}
+        yachts: list[ScrapedYachtRaw] = []
+        for yacht in self._resumed()[:max_items]:
+            if self._claim_resumed(yacht):
+                yachts.append(yacht)
+
+        # List pages are walked lazily (blocking generator in a worker thread)
+        pages = self.iter_list_pages()
+        try:
+            while len(yachts) < max_items and not self._should_stop():
+                page = await asyncio.to_thread(next, pages, None)
+                if page is None:
+                    break
+                list_url, soup, detail_urls = page
+                cards = self._list_cards(soup, list_url)
+
+                # Fetch in waves sized to the remaining budget so failed pages are
+                # replaced by later URLs, like the sequential scrape_all does
+                pending = [u for u in detail_urls
+                           if not self._checkpointed(u) and not self._filtered_out(u, cards)]
+                while pending and len(yachts) < max_items and not self._should_stop():
+                    batch, pending = pending[:max_items - len(yachts)], pending[max_items - len(yachts):]
+                    results = await asyncio.gather(*(self._scrape_detail_async(u, cards) for u in batch))
+                    for detail_url, yacht in zip(batch, results):
+                        if yacht and self._accept(yachts, yacht):
+                            self._journal(detail_url, yacht)
+        finally:
+            pages.close()
+
+        if len(yachts) >= max_items:
+            logger.info(f"[{self.source}] Reached max items limit ({max_items})")
         logger.info(f"[{self.source}] Total yachts scraped: {len(yachts)}")
         return yachts
 
+    def _produce_detail_jobs(self, pool: ProcessPoolExecutor, jobs: queue.Queue,
+                             credits: threading.Semaphore, stop: threading.Event, errors: list[BaseException]):
+        """Fetch stage: download pages and hand raw HTML to the parse pool in order.
+
+        One credit is taken per record still needed and given back when a
+        page fails, so no more detail pages are fetched than scrape_all would.
+        An exception is left in errors for the consumer to re-raise.
+        """
+        pages = self.iter_list_pages()
+        try:
+            for list_url, soup, detail_urls in pages:
+                if stop.is_set():
+                    return
+                cards = self._list_cards(soup, list_url)
+
+                for detail_url in detail_urls:
+                    if self._checkpointed(detail_url) or self._filtered_out(detail_url, cards):
+                        continue
+                    while not credits.acquire(timeout=0.5):
+                        if stop.is_set():
+                            return
+                    if stop.is_set() or self._should_stop():
+                        return
+
+                    future: Future = Future()
+                    record = self._card_record(cards.get(detail_url)) or self._unchanged_record(detail_url, cards)
+                    if record:
+                        future.set_result((record, None))
+                    else:
+                        html = self.fetch_html(detail_url)
+                        if html is None:
+                            credits.release()
+                            continue
+                        future = pool.submit(_parse_detail_html, html, detail_url)
+                    jobs.put((detail_url, cards, future, record is None))
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            pages.close()
+            jobs.put(None)
+
+    def iter_yachts_pipelined(self, max_items: int = 50, workers: Optional[int] = None) -> Iterator[ScrapedYachtRaw]:
+        """Scrape with fetching and parsing in separate stages, yielding each record as it is done.
+
+        Pages are downloaded on a producer thread while a ProcessPoolExecutor
+        builds the soup and runs parse_detail_page; results come back in
+        list order. Closing the generator stops the producer. An exception
+        on the producer thread is re-raised here once its jobs are drained.
+        """
+        count = 0
+        credits = threading.Semaphore(max_items)
+        # Resumed records use up their credits before the producer starts
+        for yacht in self._resumed()[:max_items]:
+            if self._claim_resumed(yacht):
+                count += 1
+                credits.acquire()
+                yield yacht
+        if count >= max_items:
+            logger.info(f"[{self.source}] Reached max items limit ({max_items})")
+            return
+
+        jobs: queue.Queue = queue.Queue()
+        stop = threading.Event()
+        errors: list[BaseException] = []
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(),
+                                 initializer=_init_parse_worker,
+                                 initargs=(type(self), self.parser_backend, self.list_parser_backend)) as pool:
+            backends = pool.submit(_worker_backends).result()
+            if backends != (self.parser_backend, self.list_parser_backend):
+                raise RuntimeError(f"[{self.source}] Parse workers use parser backends {backends}, "
+                                   f"expected {(self.parser_backend, self.list_parser_backend)}")
+            producer = threading.Thread(
+                target=self._produce_detail_jobs, args=(pool, jobs, credits, stop, errors), daemon=True
+            )
+            producer.start()
+            drained = False
+            try:
+                while (job := jobs.get()) is not None:
+                    detail_url, cards, future, parsed = job
+                    try:
+                        yacht, elapsed = future.result()
+                    except Exception as e:
+                        logger.error(f"Error parsing {detail_url}: {e}")
+                        yacht, elapsed = None, None
+                    if elapsed is not None:
+                        self.metrics.observe("parse_seconds", elapsed, source=self.source.value, page="detail")
+                    if parsed:
+                        yacht = self._finish_detail(detail_url, cards, yacht)
+
+                    if not yacht or not self._claim(yacht):
+                        credits.release()
+                        continue
+                    count += 1
+                    self._journal(detail_url, yacht)
+                    if count >= max_items:
+                        logger.info(f"[{self.source}] Reached max items limit ({max_items})")
+                        stop.set()
+                    yield yacht
+                drained = True
+            finally:
+                stop.set()
+                producer.join()
+                if not drained:
+                    # Closed early: drop the parses still queued
+                    while (job := jobs.get()) is not None:
+                        job[2].cancel()
+        if errors:
+            raise errors[0]
+
+        logger.info(f"[{self.source}] Total yachts scraped: {count}")
+
+    def scrape_all_pipelined(self, max_items: int = 50, workers: Optional[int] = None) -> list[ScrapedYachtRaw]:
+        """Pipelined variant of scrape_all"""
+        return list(self.iter_yachts_pipelined(max_items, workers))
+
     def parse_list_page_with_data(self, soup: BeautifulSoup, url: str) -> list[ScrapedYachtRaw]:
         """Parse list page and extract yacht data directly (override in subclass)"""
         return []
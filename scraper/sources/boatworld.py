@@ -4,7 +4,7 @@ https://www.boatworld.jp/
 Wide variety of motor boats and yachts
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Optional
 import re
 import logging
@@ -22,13 +22,16 @@ class BoatWorldScraper(BaseYachtScraper):
     source = YachtSource.BOATWORLD
     base_url = "https://www.boatworld.jp"
 
+    # List pages only need the detail links and pagination
+    list_parser_backend = "strained"
+    list_strainer = SoupStrainer(["li", "a", "link"])
+
+    # Stock list pages are numbered with ?page=N
+    page_param = "page"
+
     def get_list_urls(self) -> list[str]:
-        """Return yacht and boat listing pages"""
-        return [
-            f"{self.base_url}/boat/stockList/index.html",
-            f"{self.base_url}/boat/stockList/index.html?page=2",
-            f"{self.base_url}/boat/stockList/index.html?page=3",
-        ]
+        """Return the first stock list page, later pages are discovered while crawling"""
+        return [f"{self.base_url}/boat/stockList/index.html"]
 
     def parse_list_page(self, soup: BeautifulSoup) -> list[str]:
         """Parse the boat listing page"""
@@ -97,6 +100,7 @@ class BoatWorldScraper(BaseYachtScraper):
                     raw_name=raw_name,
                     raw_maker=raw_maker,
                     raw_price=raw_price,
+                    raw_status=self.card_status(item),
                     images=images,
                 )
                 yachts.append(yacht)
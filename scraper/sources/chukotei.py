@@ -4,8 +4,9 @@ https://www.chukotei.com/
 Largest Japanese used boat marketplace
 """
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from typing import Optional
+from urllib.parse import parse_qs, urlencode, urlparse
 import re
 import logging
 
@@ -22,6 +23,10 @@ class ChukoteiScraper(BaseYachtScraper):
     source = YachtSource.CHUKOTEI
     base_url = "https://www.chukotei.com"
 
+    # List pages only need the detail links and pagination
+    list_parser_backend = "strained"
+    list_strainer = SoupStrainer(["a", "link"])
+
     def get_list_urls(self) -> list[str]:
         """Return yacht category listing pages"""
         return [
@@ -31,6 +36,18 @@ class ChukoteiScraper(BaseYachtScraper):
             f"{self.base_url}/ship/ship_list.php?m=si&ship_type_data[1]=1&ship_feet_from=30",
         ]
 
+    def apply_list_filters(self, url: str) -> str:
+        """Push the minimum length into the search as ship_feet_from (whole feet, rounded down)"""
+        if not self.filters or self.filters.min_length_m is None:
+            return url
+        feet = int(self.filters.min_length_m / 0.3048)
+        parsed = urlparse(url)
+        query = parse_qs(parsed.query, keep_blank_values=True)
+        # A seed may already ask for longer boats
+        current = int(query.get("ship_feet_from", ["0"])[0])
+        query["ship_feet_from"] = [str(max(current, feet))]
+        return parsed._replace(query=urlencode(query, doseq=True, safe="[]")).geturl()
+
     def parse_list_page(self, soup: BeautifulSoup) -> list[str]:
         """Parse the boat listing page"""
         detail_urls = []
@@ -114,6 +131,7 @@ class ChukoteiScraper(BaseYachtScraper):
                     raw_price=raw_price,
                     raw_length=raw_length,
                     raw_year=raw_year,
+                    raw_status=self.card_status(item),
                     images=images,
                 )
                 yachts.append(yacht)
@@ -0,0 +1,94 @@
+"""
+HTML parser backends for the scrapers
+
+- "bs4":      full BeautifulSoup tree (lxml builder), the reference backend
+- "strained": BeautifulSoup limited by a SoupStrainer, for list pages that
+              only need their detail links
+- "lxml":     raw lxml.html tree wrapped in a thin BeautifulSoup-compatible
+              layer (select, select_one, get, get_text); an empty page
+              falls back to the bs4 tree
+"""
+
+import threading
+from functools import lru_cache
+from typing import Optional, Union
+
+import lxml.html
+from lxml import etree
+from bs4 import BeautifulSoup, SoupStrainer
+from cssselect import HTMLTranslator
+
+BACKENDS = ("bs4", "strained", "lxml")
+
+# Text nodes BeautifulSoup's get_text() skips
+_TEXT_XPATH = etree.XPath(".//text()[not(ancestor::script) and not(ancestor::style) and not(ancestor::template)]")
+
+
+_local = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    # One parser per thread; fed UTF-8 bytes so an <?xml encoding=...?> or
+    # <meta charset> in the already decoded text is not applied again
+    if not hasattr(_local, "parser"):
+        _local.parser = lxml.html.HTMLParser(encoding="utf-8")
+    return _local.parser
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(css: str) -> etree.XPath:
+    # "descendant::" matches BeautifulSoup, which never returns the element itself
+    return etree.XPath(HTMLTranslator().css_to_xpath(css, prefix="descendant::"))
+
+
+class LxmlNode:
+    """Minimal BeautifulSoup Tag interface over an lxml element"""
+
+    __slots__ = ("element",)
+
+    def __init__(self, element: etree._Element):
+        self.element = element
+
+    @property
+    def name(self) -> str:
+        return self.element.tag
+
+    def select(self, css: str) -> list["LxmlNode"]:
+        return [LxmlNode(e) for e in _compile_selector(css)(self.element)]
+
+    def select_one(self, css: str) -> Optional["LxmlNode"]:
+        matches = _compile_selector(css)(self.element)
+        return LxmlNode(matches[0]) if matches else None
+
+    def get(self, attr: str, default=None):
+        return self.element.get(attr, default)
+
+    def __getitem__(self, attr: str):
+        value = self.element.get(attr)
+        if value is None:
+            raise KeyError(attr)
+        return value
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        pieces = _TEXT_XPATH(self.element)
+        if strip:
+            pieces = [p.strip() for p in pieces if p.strip()]
+        return separator.join(pieces)
+
+
+Document = Union[BeautifulSoup, LxmlNode]
+
+
+def make_soup(html: str, backend: str = "bs4", strainer: Optional[SoupStrainer] = None) -> Document:
+    """Parse a page with the given backend"""
+    if backend == "lxml":
+        try:
+            return LxmlNode(lxml.html.document_fromstring(html.encode("utf-8"), parser=_html_parser()))
+        except etree.ParserError:
+            # Empty or whitespace-only page: the reference backend returns an empty tree
+            return BeautifulSoup(html, "lxml")
+    if backend == "strained" and strainer is not None:
+        return BeautifulSoup(html, "lxml", parse_only=strainer)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend}")
+    return BeautifulSoup(html, "lxml")
@@ -0,0 +1,119 @@
+"""
+Shared HTTP transport for the scrapers
+One requests.Session with sized per-host connection pools and keep-alive,
+advertising every content encoding urllib3 can decode (gzip/deflate, plus
+br/zstd when the brotli/zstandard packages are installed). Bytes on the
+wire and connections opened are tracked per source.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8",
+    "Accept-Language": "ja,en-US;q=0.9,en;q=0.8",
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Connection": "keep-alive",
+}
+
+
+@dataclass
+class TransportStats:
+    requests: int = 0
+    wire_bytes: int = 0
+    body_bytes: int = 0
+    hosts: set[str] = field(default_factory=set)
+
+
+class HttpTransport:
+    """requests.Session wrapper shared by scrapers (and later pipeline stages)"""
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 4):
+        """
+        pool_connections: number of per-host pools kept alive
+        pool_maxsize:     connections kept per host, match the per-host concurrency
+        """
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._adapter = adapter
+        self._stats: dict[str, TransportStats] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str, source: str = "other", **kwargs) -> requests.Response:
+        response = self.session.get(url, **kwargs)
+        # raw.tell() counts the (possibly compressed) bytes read off the socket
+        wire = response.raw.tell() if response.raw is not None else len(response.content)
+        with self._lock:
+            stats = self._stats.setdefault(source, TransportStats())
+            stats.requests += 1
+            stats.wire_bytes += wire
+            stats.body_bytes += len(response.content)
+            stats.hosts.add(urlparse(url).netloc)
+        return response
+
+    def get_prefix(self, url: str, max_bytes: int, source: str = "other",
+                   done: Optional[Callable[[bytes], bool]] = None, **kwargs) -> tuple[requests.Response, bytes]:
+        """GET at most max_bytes of the body, stopping early once done(data) is true.
+
+        Sends a Range header; servers that ignore it have their connection
+        closed after the bytes we need instead of sending the whole body.
+        """
+        headers = {"Range": f"bytes=0-{max_bytes - 1}", **kwargs.pop("headers", {})}
+        data = b""
+        with self.session.get(url, headers=headers, stream=True, **kwargs) as response:
+            if response.status_code < 300:
+                for chunk in response.iter_content(8192):
+                    data += chunk
+                    if len(data) >= max_bytes or (done and done(data)):
+                        break
+            wire = response.raw.tell() if response.raw is not None else len(data)
+        with self._lock:
+            stats = self._stats.setdefault(source, TransportStats())
+            stats.requests += 1
+            stats.wire_bytes += wire
+            stats.body_bytes += len(data)
+            stats.hosts.add(urlparse(url).netloc)
+        return response, data[:max_bytes]
+
+    def connections_opened(self) -> dict[str, int]:
+        """New connections opened so far, per host"""
+        pools = self._adapter.poolmanager.pools
+        opened: dict[str, int] = {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                opened[pool.host] = opened.get(pool.host, 0) + pool.num_connections
+        return opened
+
+    def stats(self) -> dict[str, dict]:
+        """Per-source requests, bytes on the wire vs decoded, and connections opened"""
+        opened = self.connections_opened()
+        with self._lock:
+            return {
+                source: {
+                    "requests": s.requests,
+                    "wire_bytes": s.wire_bytes,
+                    "body_bytes": s.body_bytes,
+                    "connections": sum(opened.get(host.split(":")[0], 0) for host in s.hosts),
+                }
+                for source, s in self._stats.items()
+            }
+
+    def log_stats(self):
+        for source, s in self.stats().items():
+            saved = 1 - s["wire_bytes"] / s["body_bytes"] if s["body_bytes"] else 0
+            logger.info(f"Transport [{source}]: {s['requests']} requests over {s['connections']} connections, "
+                        f"{s['wire_bytes']} bytes on the wire ({saved:.0%} saved by compression)")